@@ -206,7 +206,7 @@ class GeminiClient(BaseLLMClient):
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n{prompt}"
 
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: client.generate_content(
@@ -262,7 +262,7 @@ class GeminiClient(BaseLLMClient):
         try:
             client = self._get_client()
             # 簡単なテストを実行
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,
                 lambda: client.generate_content("Hello"),
@@ -1,9 +1,14 @@
 """音声処理・文字起こしモジュール."""
 
 import asyncio
+import json
+import os
 import platform
+import shutil
 import subprocess
+import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -29,6 +34,9 @@ class TranscriptionError(Exception):
 class AudioProcessor:
     """音声処理クラス."""
 
+    # 失敗時のエラーメッセージに残すFFmpeg出力の行数
+    FFMPEG_STDERR_TAIL_LINES = 200
+
     def __init__(self, temp_dir: Optional[Path] = None) -> None:
         """初期化.
 
@@ -66,12 +74,24 @@ class AudioProcessor:
         if progress_callback:
             progress_callback(0, "音声抽出中...")
 
+        # 既に16kHzモノラルのWAVなら再エンコード不要
+        if video_path.suffix.lower() == ".wav" and await self._is_whisper_ready_wav(video_path):
+            self._link_or_copy(video_path, output_path)
+
+            if progress_callback:
+                progress_callback(100, "音声抽出完了")
+
+            return output_path
+
         # FFmpegで音声抽出
         cmd = [
             "ffmpeg",
             "-y",
+            "-nostats",  # 進捗行（\r区切り）を出力しない
             "-i", str(video_path),
-            "-vn",  # 映像なし
+            "-map", "0:a:0",  # 最初の音声ストリームのみ
+            "-vn",  # 映像なし（映像はデコードしない）
+            "-threads", "0",  # スレッド数は自動
             "-acodec", "pcm_s16le",  # WAV形式
             "-ar", "16000",  # 16kHz（Whisper推奨）
             "-ac", "1",  # モノラル
@@ -79,10 +99,7 @@ class AudioProcessor:
         ]
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, lambda: self._run_ffmpeg(cmd)
-            )
+            await self._run_ffmpeg(cmd)
 
             if progress_callback:
                 progress_callback(100, "音声抽出完了")
@@ -92,19 +109,85 @@ class AudioProcessor:
         except subprocess.CalledProcessError as e:
             raise AudioProcessError(f"FFmpeg failed: {e}") from e
 
-    def _run_ffmpeg(self, cmd: list[str]) -> None:
-        """FFmpegを実行（同期）."""
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
+    async def _is_whisper_ready_wav(self, audio_path: Path) -> bool:
+        """音声が既に pcm_s16le / 16kHz / モノラルか判定."""
+        cmd = [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name,sample_rate,channels",
+            "-of", "json",
+            str(audio_path),
+        ]
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await proc.communicate()
+        except OSError:
+            # ffprobeが無い場合は通常の抽出にフォールバック
+            return False
+
+        if proc.returncode != 0:
+            return False
+
+        try:
+            streams = json.loads(stdout).get("streams", [])
+        except ValueError:
+            return False
+
+        if not streams:
+            return False
+
+        stream = streams[0]
+        return (
+            stream.get("codec_name") == "pcm_s16le"
+            and str(stream.get("sample_rate")) == "16000"
+            and stream.get("channels") == 1
+        )
+
+    def _link_or_copy(self, src: Path, dst: Path) -> None:
+        """srcをdstにシンボリックリンク（不可ならコピー）."""
+        if src.resolve() == dst.resolve():
+            return
+
+        dst.unlink(missing_ok=True)
+        try:
+            os.symlink(src.resolve(), dst)
+        except OSError:
+            # Windowsなどシンボリックリンクが作れない環境
+            shutil.copyfile(src, dst)
+
+    async def _run_ffmpeg(self, cmd: list[str]) -> None:
+        """FFmpegを実行.
+
+        stderrは逐次読み捨て、失敗時の診断用に末尾のみ保持する.
+        """
+        tail: deque[str] = deque(maxlen=self.FFMPEG_STDERR_TAIL_LINES)
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
         )
-        if result.returncode != 0:
+        try:
+            async for line in proc.stderr:
+                tail.append(line.decode("utf-8", errors="replace").rstrip())
+            returncode = await proc.wait()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+
+        if returncode != 0:
             raise subprocess.CalledProcessError(
-                result.returncode,
+                returncode,
                 cmd,
-                result.stdout,
-                result.stderr,
+                None,
+                "\n".join(tail),
             )
 
 
@@ -135,11 +218,27 @@ class Transcriber:
         "distil-large-v3",
     ]
 
+    # 量子化指定 -> faster-whisper (CTranslate2) の compute_type
+    # CTranslate2はint4非対応のため、int4はint8にフォールバック
+    FASTER_WHISPER_COMPUTE_TYPES = {
+        "int8": "int8",
+        "int8_float16": "int8_float16",
+        "int4": "int8",
+    }
+
+    # 量子化指定 -> lightning-whisper-mlx の quant
+    MLX_QUANTS = {
+        "int8": "8bit",
+        "int8_float16": "8bit",
+        "int4": "4bit",
+    }
+
     def __init__(
         self,
         model: str = "distil-large-v3",
         language: Optional[str] = None,
         batch_size: int = 12,
+        quant: Optional[str] = None,
     ) -> None:
         """初期化.
 
@@ -147,37 +246,55 @@ class Transcriber:
             model: Whisperモデル名
             language: 言語コード（None=自動検出）
             batch_size: バッチサイズ
+            quant: 重みの量子化（"int8", "int8_float16", "int4"）
+                None の場合、MLXは量子化なし・faster-whisperはint8
         """
+        if quant is not None and quant not in self.FASTER_WHISPER_COMPUTE_TYPES:
+            raise ValueError(f"Unknown quantization: {quant}")
+
         self.model_name = model
         self.language = language
         self.batch_size = batch_size
+        self.quant = quant
         self._model = None
+        self._model_lock = threading.Lock()
         self._cancelled = False
         self._use_mlx = _is_apple_silicon()
 
     def _load_model(self) -> None:
         """モデルをロード."""
-        if self._model is not None:
-            return
+        with self._model_lock:
+            if self._model is None:
+                self._model = self._create_model()
 
+    def _create_model(self):
+        """バックエンドに応じたモデルを生成."""
         if self._use_mlx:
             from lightning_whisper_mlx import LightningWhisperMLX
 
-            self._model = LightningWhisperMLX(
+            return LightningWhisperMLX(
                 model=self.model_name,
                 batch_size=self.batch_size,
-                quant=None,  # 量子化なし（精度優先）
+                # 未指定時は量子化なし（精度優先）
+                quant=self.MLX_QUANTS.get(self.quant),
             )
         else:
             # 非Apple Silicon環境ではfaster-whisperを使用
             from faster_whisper import WhisperModel
 
-            self._model = WhisperModel(
+            return WhisperModel(
                 self.model_name,
                 device="cpu",
-                compute_type="int8",
+                compute_type=self.FASTER_WHISPER_COMPUTE_TYPES.get(self.quant, "int8"),
             )
 
+    async def preload(self) -> None:
+        """モデルを事前にロード.
+
+        音声抽出などと並行して呼び出し、transcribe開始時の待ち時間を減らす.
+        """
+        await asyncio.to_thread(self._load_model)
+
     async def transcribe(
         self,
         audio_path: Path,
@@ -206,8 +323,7 @@ class Transcriber:
                 progress_callback(0, "モデル読み込み中...")
 
             # モデルロード
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._load_model)
+            await asyncio.to_thread(self._load_model)
 
             if self._cancelled:
                 raise TranscriptionError("Transcription cancelled")
@@ -217,9 +333,9 @@ class Transcriber:
 
             # 文字起こし実行
             if self._use_mlx:
-                result = await self._transcribe_mlx(audio_path, loop)
+                result = await self._transcribe_mlx(audio_path)
             else:
-                result = await self._transcribe_faster_whisper(audio_path, loop)
+                result = await self._transcribe_faster_whisper(audio_path)
 
             if self._cancelled:
                 raise TranscriptionError("Transcription cancelled")
@@ -274,7 +390,7 @@ class Transcriber:
                 raise TranscriptionError("Transcription cancelled") from e
             raise TranscriptionError(f"Transcription failed: {e}") from e
 
-    async def _transcribe_mlx(self, audio_path: Path, loop) -> dict:
+    async def _transcribe_mlx(self, audio_path: Path) -> dict:
         """lightning-whisper-mlxで文字起こし."""
 
         def _do_transcribe():
@@ -284,9 +400,9 @@ class Transcriber:
             )
             return result
 
-        return await loop.run_in_executor(None, _do_transcribe)
+        return await asyncio.to_thread(_do_transcribe)
 
-    async def _transcribe_faster_whisper(self, audio_path: Path, loop) -> dict:
+    async def _transcribe_faster_whisper(self, audio_path: Path) -> dict:
         """faster-whisperで文字起こし."""
 
         def _do_transcribe():
@@ -311,7 +427,7 @@ class Transcriber:
                 "language": info.language,
             }
 
-        return await loop.run_in_executor(None, _do_transcribe)
+        return await asyncio.to_thread(_do_transcribe)
 
     def cancel(self) -> None:
         """文字起こしをキャンセル."""
@@ -1,10 +1,13 @@
 """プロジェクト履歴管理モジュール."""
 
-import json
-from dataclasses import dataclass, asdict
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+
+import orjson
 
 
 @dataclass
@@ -23,7 +26,8 @@ class ProjectRecord:
     thumbnail_url: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # 全フィールドが文字列/Noneなので、asdictのdeepcopyは不要
+        return self.__dict__.copy()
 
     @classmethod
     def from_dict(cls, data: dict) -> "ProjectRecord":
@@ -46,17 +50,23 @@ class ProjectHistory:
             self.history_file = history_file
 
         self._records: List[ProjectRecord] = []
+        # 検索用インデックス（_recordsの並び順は保持したまま参照する）
+        self._by_id: Dict[str, ProjectRecord] = {}
+        self._by_video: Dict[str, ProjectRecord] = {}
+        self._dirty = False
+        self._batch_depth = 0
         self._load()
 
     def _load(self) -> None:
         """履歴を読み込み."""
         if not self.history_file.exists():
             self._records = []
+            self._reindex()
             return
 
         try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.history_file, "rb") as f:
+                data = orjson.loads(f.read())
                 self._records = [
                     ProjectRecord.from_dict(item)
                     for item in data.get("projects", [])
@@ -64,16 +74,56 @@ class ProjectHistory:
         except Exception:
             self._records = []
 
-    def _save(self) -> None:
-        """履歴を保存."""
+        self._reindex()
+
+    def _reindex(self) -> None:
+        """IDと動画IDのインデックスを再構築."""
+        self._by_id = {r.id: r for r in self._records}
+        # 同じ動画IDが複数ある場合は新しい（先頭側の）記録を優先
+        self._by_video = {r.video_id: r for r in reversed(self._records)}
+
+    def flush(self) -> None:
+        """未保存の変更があれば履歴を保存."""
+        if not self._dirty:
+            return
+
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
             "projects": [r.to_dict() for r in self._records]
         }
 
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+        # 一時ファイルに書き出してから置き換え（書き込み途中のクラッシュで壊さない）
+        tmp_file = self.history_file.with_suffix(".json.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_file, self.history_file)
+        self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        """変更を記録し、バッチ外であれば即座に保存."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["ProjectHistory"]:
+        """複数の変更をまとめて1回で保存するコンテキスト.
+
+        使用例:
+            with history.batch():
+                for item in items:
+                    history.add(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
 
     def add(
         self,
@@ -115,15 +165,17 @@ class ProjectHistory:
         )
 
         # 同じvideo_idの古い記録を削除（最新のみ保持）
-        self._records = [r for r in self._records if r.video_id != video_id]
+        if video_id in self._by_video:
+            self._records = [r for r in self._records if r.video_id != video_id]
 
         # 先頭に追加
         self._records.insert(0, record)
 
         # 最大50件に制限
-        self._records = self._records[:50]
+        del self._records[50:]
 
-        self._save()
+        self._reindex()
+        self._mark_dirty()
         return record
 
     def get_all(self) -> List[ProjectRecord]:
@@ -154,10 +206,7 @@ class ProjectHistory:
         Returns:
             ProjectRecord または None
         """
-        for record in self._records:
-            if record.id == project_id:
-                return record
-        return None
+        return self._by_id.get(project_id)
 
     def delete(self, project_id: str) -> bool:
         """プロジェクトを削除.
@@ -168,15 +217,16 @@ class ProjectHistory:
         Returns:
             削除成功時True
         """
-        original_count = len(self._records)
-        self._records = [r for r in self._records if r.id != project_id]
+        if project_id not in self._by_id:
+            return False
 
-        if len(self._records) < original_count:
-            self._save()
-            return True
-        return False
+        self._records = [r for r in self._records if r.id != project_id]
+        self._reindex()
+        self._mark_dirty()
+        return True
 
     def clear(self) -> None:
         """全履歴をクリア."""
         self._records = []
-        self._save()
+        self._reindex()
+        self._mark_dirty()
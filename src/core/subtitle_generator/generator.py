@@ -1,7 +1,10 @@
 """字幕生成モジュール."""
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pysubs2
 
 from src.models import (
@@ -13,6 +16,34 @@ from src.models import (
     TranslationResult,
 )
 
+# 日本語（ひらがな・カタカナ・漢字）の検出用
+_JP_RE = re.compile(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff]")
+
+# 日本語テキストの分割に使う区切り文字
+_JA_DELIMITERS = frozenset("。！？、」』．，")
+
+# 英語テキストの文末分割用
+_SENT_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# 出力フォーマットごとの拡張子
+_EXTENSIONS = {
+    SubtitleFormat.SRT: ".srt",
+    SubtitleFormat.ASS: ".ass",
+    SubtitleFormat.VTT: ".vtt",
+}
+
+
+@lru_cache(maxsize=64)
+def _parse_hex_color(color: str) -> tuple[int, int, int, int]:
+    """RRGGBB / RRGGBBAA を (r, g, b, a) に変換."""
+    if len(color) == 6:
+        value = int(color, 16)
+        return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF, 0
+    if len(color) == 8:
+        value = int(color, 16)
+        return (value >> 24) & 0xFF, (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+    return 255, 255, 255, 0
+
 
 class SubtitleGeneratorError(Exception):
     """字幕生成エラー."""
@@ -64,8 +95,29 @@ class SubtitleGenerator:
         Returns:
             SubtitleResult
         """
+        return self.generate_multi(translation, [(output_path, output_format)], bilingual)[0]
+
+    def generate_multi(
+        self,
+        translation: TranslationResult,
+        outputs: list[tuple[Path, SubtitleFormat]],
+        bilingual: bool = False,
+    ) -> list[SubtitleResult]:
+        """同じ翻訳結果から複数フォーマットの字幕ファイルを生成.
+
+        字幕エントリの作成とタイミング最適化は1回だけ行い、各フォーマットで保存する。
+        ASS を含む場合はスタイルも設定する（SRT などはそのスタイルから変換した場合と同じ出力になる）。
+
+        Args:
+            translation: 翻訳結果
+            outputs: (出力パス, 出力フォーマット) のリスト
+            bilingual: 二言語表示
+
+        Returns:
+            outputs と同じ順の SubtitleResult のリスト
+        """
         # 字幕エントリを作成
-        entries = self._create_entries(translation.segments, bilingual)
+        entries, japanese_flags = self._create_entries(translation.segments, bilingual)
 
         # タイミングを最適化
         entries = self._optimize_timing(entries)
@@ -74,59 +126,76 @@ class SubtitleGenerator:
         subs = pysubs2.SSAFile()
 
         # スタイルを設定（ASS形式の場合）
-        if output_format == SubtitleFormat.ASS:
+        if any(output_format == SubtitleFormat.ASS for _, output_format in outputs):
             self._setup_styles(subs)
 
-        # イベントを追加
-        for entry in entries:
-            event = pysubs2.SSAEvent(
+        # イベントをまとめて追加
+        format_text = self._format_text
+        subs.events.extend(
+            pysubs2.SSAEvent(
                 start=int(entry.start * 1000),  # ミリ秒
                 end=int(entry.end * 1000),
-                text=self._format_text(entry.text, entry.original_text, bilingual),
+                text=format_text(entry.text, entry.original_text, bilingual, has_japanese),
                 style=entry.style or "Default",
             )
-            subs.append(event)
+            for entry, has_japanese in zip(entries, japanese_flags)
+        )
 
-        # ファイル拡張子を確認・修正
-        output_path = self._ensure_extension(output_path, output_format)
+        results = []
+        for output_path, output_format in outputs:
+            # ファイル拡張子を確認・修正
+            output_path = self._ensure_extension(output_path, output_format)
 
-        # 保存
-        subs.save(str(output_path), format_=output_format.value)
+            # 保存
+            subs.save(str(output_path), format_=output_format.value)
 
-        return SubtitleResult(
-            file_path=output_path,
-            format=output_format,
-            subtitle_count=len(entries),
-            total_duration=entries[-1].end if entries else 0,
-            style_applied=self.style_config,
-        )
+            results.append(SubtitleResult(
+                file_path=output_path,
+                format=output_format,
+                subtitle_count=len(entries),
+                total_duration=entries[-1].end if entries else 0,
+                style_applied=self.style_config,
+            ))
+
+        return results
 
     def _create_entries(
         self,
         segments: list[TranslatedSegment],
         bilingual: bool,
-    ) -> list[SubtitleEntry]:
-        """字幕エントリを作成（長いセグメントは分割）."""
+    ) -> tuple[list[SubtitleEntry], list[bool]]:
+        """字幕エントリを作成（長いセグメントは分割）.
+
+        Returns:
+            (字幕エントリ, 各エントリが日本語を含むか)
+        """
+        # 日本語判定はセグメントごとに1回だけ行い、分割・改行の両方で使う
+        japanese_flags = [self._has_japanese(seg.translated_text) for seg in segments]
+
         entries = []
+        entry_flags = []
         entry_id = 0
 
-        for seg in segments:
+        for seg, has_japanese in zip(segments, japanese_flags):
             # セグメントを分割
             split_entries = self._split_segment(
                 seg,
                 bilingual,
                 start_id=entry_id,
+                has_japanese=has_japanese,
             )
             entries.extend(split_entries)
+            entry_flags.extend([has_japanese] * len(split_entries))
             entry_id += len(split_entries)
 
-        return entries
+        return entries, entry_flags
 
     def _split_segment(
         self,
         seg: TranslatedSegment,
         bilingual: bool,
         start_id: int,
+        has_japanese: Optional[bool] = None,
     ) -> list[SubtitleEntry]:
         """長いセグメントを適切な長さに分割."""
         text = seg.translated_text
@@ -134,7 +203,8 @@ class SubtitleGenerator:
         duration = seg.end - seg.start
 
         # 日本語かどうかを判定
-        has_japanese = self._has_japanese(text)
+        if has_japanese is None:
+            has_japanese = self._has_japanese(text)
         max_chars = (
             self.MAX_CHARS_PER_SEGMENT_JA if has_japanese else self.MAX_CHARS_PER_SEGMENT_EN
         )
@@ -204,50 +274,41 @@ class SubtitleGenerator:
         chunks = []
 
         if is_japanese:
-            # 日本語: 句読点で分割
-            delimiters = ["。", "！", "？", "、", "」", "』", "．", "，"]
-            current_chunk = ""
+            # 日本語: 句読点で分割（インデックスで切り出し、文字列連結を避ける）
+            chunk_start = 0
 
-            i = 0
-            while i < len(text):
-                char = text[i]
-                current_chunk += char
+            for i, char in enumerate(text):
+                chunk_len = i - chunk_start + 1
 
                 # 区切り文字に到達 or 最大文字数に到達
-                is_delimiter = char in delimiters
-                is_max_length = len(current_chunk) >= max_chars
-
-                if is_delimiter or is_max_length:
-                    # 最大文字数を超えている場合、適切な位置で切る
-                    if is_max_length and not is_delimiter:
-                        # 近くの区切り文字を探す
-                        best_split = -1
-                        for d in delimiters:
-                            pos = current_chunk.rfind(d)
-                            if pos > best_split and pos > max_chars // 2:
-                                best_split = pos
-
-                        if best_split > 0:
-                            # 区切り文字の位置で分割
-                            chunks.append(current_chunk[: best_split + 1].strip())
-                            current_chunk = current_chunk[best_split + 1 :]
-                        else:
-                            # 区切り文字がなければそのまま追加
-                            chunks.append(current_chunk.strip())
-                            current_chunk = ""
-                    elif is_delimiter and len(current_chunk) >= max_chars * 0.5:
-                        # 区切り文字で、十分な長さがあれば分割
-                        chunks.append(current_chunk.strip())
-                        current_chunk = ""
-
-                i += 1
-
-            if current_chunk.strip():
-                chunks.append(current_chunk.strip())
+                is_delimiter = char in _JA_DELIMITERS
+                is_max_length = chunk_len >= max_chars
+
+                if is_max_length and not is_delimiter:
+                    # 近くの区切り文字を探す
+                    best_split = max(
+                        text.rfind(d, chunk_start, i + 1) for d in _JA_DELIMITERS
+                    ) - chunk_start
+
+                    if best_split > max_chars // 2:
+                        # 区切り文字の位置で分割
+                        chunks.append(text[chunk_start : chunk_start + best_split + 1].strip())
+                        chunk_start += best_split + 1
+                    else:
+                        # 区切り文字がなければそのまま追加
+                        chunks.append(text[chunk_start : i + 1].strip())
+                        chunk_start = i + 1
+                elif is_delimiter and chunk_len >= max_chars * 0.5:
+                    # 区切り文字で、十分な長さがあれば分割
+                    chunks.append(text[chunk_start : i + 1].strip())
+                    chunk_start = i + 1
+
+            remainder = text[chunk_start:].strip()
+            if remainder:
+                chunks.append(remainder)
         else:
             # 英語: 文末で分割
-            import re
-            sentences = re.split(r'(?<=[.!?])\s+', text)
+            sentences = _SENT_SPLIT_RE.split(text)
 
             current_chunk = ""
             for sentence in sentences:
@@ -278,38 +339,32 @@ class SubtitleGenerator:
 
     def _has_japanese(self, text: str) -> bool:
         """日本語が含まれているか判定."""
-        return any(
-            "\u3040" <= c <= "\u309f" or  # ひらがな
-            "\u30a0" <= c <= "\u30ff" or  # カタカナ
-            "\u4e00" <= c <= "\u9fff"  # 漢字
-            for c in text
-        )
+        return _JP_RE.search(text) is not None
 
     def _optimize_timing(self, entries: list[SubtitleEntry]) -> list[SubtitleEntry]:
         """タイミングを最適化."""
         if not entries:
             return entries
 
-        optimized = []
+        count = len(entries)
+        starts = np.fromiter((e.start for e in entries), dtype=np.float64, count=count)
+        ends = np.fromiter((e.end for e in entries), dtype=np.float64, count=count)
 
-        for i, entry in enumerate(entries):
-            # 最小表示時間を確保
-            duration = entry.end - entry.start
-            if duration < self.MIN_DURATION:
-                entry.end = entry.start + self.MIN_DURATION
+        # 最小表示時間を確保・最大表示時間を制限
+        durations = ends - starts
+        ends = np.where(durations < self.MIN_DURATION, starts + self.MIN_DURATION, ends)
+        ends = np.where(durations > self.MAX_DURATION, starts + self.MAX_DURATION, ends)
 
-            # 最大表示時間を制限
-            if duration > self.MAX_DURATION:
-                entry.end = entry.start + self.MAX_DURATION
-
-            # 重複を解消
-            if optimized and entry.start < optimized[-1].end:
-                gap = self.GAP_THRESHOLD
-                optimized[-1].end = entry.start - gap
+        # 重複を解消（次の字幕の開始より後に終わる字幕を切り詰める）
+        next_starts = starts[1:]
+        ends[:-1] = np.where(
+            next_starts < ends[:-1], next_starts - self.GAP_THRESHOLD, ends[:-1]
+        )
 
-            optimized.append(entry)
+        for entry, end in zip(entries, ends.tolist()):
+            entry.end = end
 
-        return optimized
+        return entries
 
     def _setup_styles(self, subs: pysubs2.SSAFile) -> None:
         """ASSスタイルを設定."""
@@ -346,32 +401,18 @@ class SubtitleGenerator:
     def _parse_color(self, color: str) -> pysubs2.Color:
         """カラーコードをpysubs2.Colorに変換."""
         # #RRGGBB -> pysubs2.Color
-        color = color.lstrip("#")
-
-        if len(color) == 6:
-            r = int(color[0:2], 16)
-            g = int(color[2:4], 16)
-            b = int(color[4:6], 16)
-            a = 0
-        elif len(color) == 8:
-            r = int(color[0:2], 16)
-            g = int(color[2:4], 16)
-            b = int(color[4:6], 16)
-            a = int(color[6:8], 16)
-        else:
-            r, g, b, a = 255, 255, 255, 0
-
-        return pysubs2.Color(r, g, b, a)
+        return pysubs2.Color(*_parse_hex_color(color.lstrip("#")))
 
     def _format_text(
         self,
         text: str,
         original_text: Optional[str],
         bilingual: bool,
+        has_japanese: Optional[bool] = None,
     ) -> str:
         """テキストを整形."""
         # テキストを適切な長さで改行
-        formatted = self._wrap_text(text)
+        formatted = self._wrap_text(text, has_japanese=has_japanese)
 
         # 二言語表示
         if bilingual and original_text:
@@ -381,31 +422,50 @@ class SubtitleGenerator:
 
         return formatted
 
-    def _wrap_text(self, text: str, max_chars: Optional[int] = None) -> str:
+    def _wrap_text(
+        self,
+        text: str,
+        max_chars: Optional[int] = None,
+        has_japanese: Optional[bool] = None,
+    ) -> str:
         """テキストを適切な長さで改行."""
+        text_len = len(text)
+
         if max_chars is None:
-            has_japanese = self._has_japanese(text)
+            # どちらの言語でも収まる長さなら判定不要
+            if text_len <= min(self.MAX_CHARS_PER_LINE_JA, self.MAX_CHARS_PER_LINE_EN):
+                return text
+            if has_japanese is None:
+                has_japanese = self._has_japanese(text)
             max_chars = (
                 self.MAX_CHARS_PER_LINE_JA if has_japanese else self.MAX_CHARS_PER_LINE_EN
             )
 
-        if len(text) <= max_chars:
+        if text_len <= max_chars:
             return text
 
         # 適切な位置で改行
         lines = []
-        current_line = ""
+        current_words: list[str] = []
+        current_len = 0
 
         for word in text.split():
-            if len(current_line) + len(word) + 1 <= max_chars:
-                current_line += (" " if current_line else "") + word
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            lines.append(current_line)
+            if current_words and current_len + len(word) + 1 <= max_chars:
+                current_words.append(word)
+                current_len += len(word) + 1
+                continue
+
+            if current_words:
+                lines.append(" ".join(current_words))
+                # 最大行数を超えた分は捨てるので、それ以上は組み立てない
+                if len(lines) > self.MAX_LINES:
+                    current_words = []
+                    break
+            current_words = [word]
+            current_len = len(word)
+
+        if current_words:
+            lines.append(" ".join(current_words))
 
         # 最大行数を制限
         if len(lines) > self.MAX_LINES:
@@ -416,12 +476,7 @@ class SubtitleGenerator:
 
     def _ensure_extension(self, path: Path, format: SubtitleFormat) -> Path:
         """拡張子を確認・修正."""
-        ext_map = {
-            SubtitleFormat.SRT: ".srt",
-            SubtitleFormat.ASS: ".ass",
-            SubtitleFormat.VTT: ".vtt",
-        }
-        expected_ext = ext_map.get(format, ".srt")
+        expected_ext = _EXTENSIONS.get(format, ".srt")
 
         if path.suffix.lower() != expected_ext:
             path = path.with_suffix(expected_ext)
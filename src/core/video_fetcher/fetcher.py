@@ -1,8 +1,13 @@
 """動画取得モジュール."""
 import asyncio
+import copy
+import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -10,6 +15,12 @@ import yt_dlp
 
 from src.models import DownloadResult, VideoInfo, VideoMetadata
 
+# YouTubeのURL正規表現（watch / shorts / youtu.be / embed）
+_ID_PATTERN = r"(?:youtube\.com/(?:watch\?v=|shorts/|embed/)|youtu\.be/)([a-zA-Z0-9_-]{11})"
+_ID_RE = re.compile(_ID_PATTERN)
+# 貼り付けられたURLそのもの（先頭から始まる）用の高速パス
+_ID_RE_ANCHORED = re.compile(r"(?:https?://)?(?:www\.)?" + _ID_PATTERN)
+
 
 class VideoFetchError(Exception):
     """動画取得エラー."""
@@ -17,16 +28,60 @@ class VideoFetchError(Exception):
     pass
 
 
+def _throttle_progress(
+    callback: Callable[[float, str], None],
+    interval: float,
+) -> Callable[[float, str], None]:
+    """進捗コールバックを間引く（100%は必ず通知）.
+
+    Args:
+        callback: 元のコールバック
+        interval: 最小通知間隔（秒）
+    """
+    last_emitted = 0.0
+
+    def throttled(progress: float, status: str) -> None:
+        nonlocal last_emitted
+        now = time.monotonic()
+        if progress >= 100 or now - last_emitted >= interval:
+            last_emitted = now
+            callback(progress, status)
+
+    return throttled
+
+
 class VideoFetcher:
     """YouTube動画取得クラス."""
 
-    # YouTubeのURL正規表現パターン
-    YOUTUBE_PATTERNS = [
-        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-        r"(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})",
-        r"(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})",
-        r"(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})",
-    ]
+    # 品質ごとのyt-dlpフォーマット指定
+    _QUALITY_MAP = {
+        "360p": "bestvideo[height<=360]+bestaudio/best[height<=360]",
+        "480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
+        "720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
+        "1080p": "bestvideo[height<=1080]+bestaudio/best[height<=1080]",
+        "1440p": "bestvideo[height<=1440]+bestaudio/best[height<=1440]",
+        "2160p": "bestvideo[height<=2160]+bestaudio/best[height<=2160]",
+    }
+
+    # ダウンロード後のファイルを探す拡張子（優先順）
+    _AUDIO_EXTS = ("m4a", "mp3", "opus", "webm")
+    _VIDEO_EXTS = ("mp4", "webm", "mkv")
+
+    # yt-dlp実行用スレッドの上限
+    MAX_WORKERS = 4
+
+    # ダウンロード進捗の最小通知間隔（秒）
+    PROGRESS_INTERVAL = 0.1
+
+    # 動画情報キャッシュの有効期間（秒）
+    INFO_CACHE_TTL = 300.0
+
+    # 情報取得用のyt-dlpオプション
+    _INFO_OPTS = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": False,
+    }
 
     def __init__(
         self,
@@ -42,7 +97,17 @@ class VideoFetcher:
         self.download_dir = download_dir or Path("./downloads")
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.quality = quality
-        self._cancelled = False
+        # キャンセル要求（GUIスレッドから設定し、yt-dlpのスレッドで参照）
+        self._cancel_event = threading.Event()
+        # video_id -> (取得時刻, yt-dlp情報)
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        # 情報取得用のYoutubeDLは使い回してHTTP接続を再利用する
+        self._ydl_info: Optional[yt_dlp.YoutubeDL] = None
+        self._ydl_lock = threading.Lock()
+        # yt-dlpのブロッキング処理は専用スレッドプールで実行
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="ytdlp"
+        )
 
     @staticmethod
     def extract_video_id(url: str) -> Optional[str]:
@@ -54,11 +119,8 @@ class VideoFetcher:
         Returns:
             動画ID または None
         """
-        for pattern in VideoFetcher.YOUTUBE_PATTERNS:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        match = _ID_RE_ANCHORED.match(url) or _ID_RE.search(url)
+        return match.group(1) if match else None
 
     @staticmethod
     def is_valid_youtube_url(url: str) -> bool:
@@ -81,17 +143,12 @@ class VideoFetcher:
         if not video_id:
             raise VideoFetchError(f"Invalid YouTube URL: {url}")
 
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": False,
-        }
-
         try:
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None, lambda: self._extract_info(url, ydl_opts)
-            )
+            info = self._get_cached_info(video_id)
+            if info is None:
+                loop = asyncio.get_running_loop()
+                info = await loop.run_in_executor(self._executor, self._extract_info, url)
+                self._cache_info(video_id, info)
 
             return VideoInfo(
                 video_id=video_id,
@@ -106,10 +163,29 @@ class VideoFetcher:
         except Exception as e:
             raise VideoFetchError(f"Failed to get video info: {e}") from e
 
-    def _extract_info(self, url: str, ydl_opts: dict) -> dict:
+    def _extract_info(self, url: str) -> dict:
         """yt-dlpで情報を抽出（同期）."""
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            return ydl.extract_info(url, download=False)
+        # YoutubeDLはスレッドセーフではないためロックで直列化
+        with self._ydl_lock:
+            if self._ydl_info is None:
+                self._ydl_info = yt_dlp.YoutubeDL(self._INFO_OPTS)
+            return self._ydl_info.extract_info(url, download=False)
+
+    def _get_cached_info(self, video_id: str) -> Optional[dict]:
+        """キャッシュ済みの動画情報を取得（期限切れはNone）."""
+        cached = self._info_cache.get(video_id)
+        if cached is None:
+            return None
+
+        fetched_at, info = cached
+        if time.monotonic() - fetched_at > self.INFO_CACHE_TTL:
+            del self._info_cache[video_id]
+            return None
+        return info
+
+    def _cache_info(self, video_id: str, info: dict) -> None:
+        """動画情報をキャッシュ."""
+        self._info_cache[video_id] = (time.monotonic(), info)
 
     async def download(
         self,
@@ -127,9 +203,7 @@ class VideoFetcher:
         Returns:
             DownloadResult
         """
-        self._cancelled = False
-        start_time = time.time()
-
+        # 無効なURLは何も準備せずに即座に返す
         video_id = self.extract_video_id(url)
         if not video_id:
             return DownloadResult(
@@ -137,34 +211,29 @@ class VideoFetcher:
                 error=f"Invalid YouTube URL: {url}",
             )
 
-        # 出力パス
-        video_path = self.download_dir / f"{video_id}.mp4"
-        audio_path = self.download_dir / f"{video_id}.m4a"
+        self._cancel_event.clear()
+        start_time = time.time()
 
         # 品質に応じたフォーマット指定
-        quality_map = {
-            "360p": "bestvideo[height<=360]+bestaudio/best[height<=360]",
-            "480p": "bestvideo[height<=480]+bestaudio/best[height<=480]",
-            "720p": "bestvideo[height<=720]+bestaudio/best[height<=720]",
-            "1080p": "bestvideo[height<=1080]+bestaudio/best[height<=1080]",
-            "1440p": "bestvideo[height<=1440]+bestaudio/best[height<=1440]",
-            "2160p": "bestvideo[height<=2160]+bestaudio/best[height<=2160]",
-        }
-
-        format_spec = quality_map.get(self.quality, quality_map["1080p"])
+        format_spec = self._QUALITY_MAP.get(self.quality, self._QUALITY_MAP["1080p"])
 
         if download_audio_only:
             format_spec = "bestaudio[ext=m4a]/bestaudio"
 
+        # yt-dlpは数KBごとにフックを呼ぶため、GUIへの通知は間引く
+        hook_callback = (
+            _throttle_progress(progress_callback, self.PROGRESS_INTERVAL)
+            if progress_callback
+            else None
+        )
+
         # yt-dlp オプション
         ydl_opts = {
             "format": format_spec,
             "outtmpl": str(self.download_dir / "%(id)s.%(ext)s"),
             "quiet": True,
             "no_warnings": True,
-            "progress_hooks": [
-                lambda d: self._progress_hook(d, progress_callback)
-            ],
+            "progress_hooks": [partial(self._progress_hook, callback=hook_callback)],
             "merge_output_format": "mp4",
             "postprocessors": [],
         }
@@ -179,12 +248,15 @@ class VideoFetcher:
             if progress_callback:
                 progress_callback(0, "ダウンロード開始...")
 
-            loop = asyncio.get_event_loop()
+            # get_video_info済みなら情報抽出を省略してダウンロードのみ行う
+            cached_info = self._get_cached_info(video_id)
+
+            loop = asyncio.get_running_loop()
             info = await loop.run_in_executor(
-                None, lambda: self._download(url, ydl_opts)
+                self._executor, self._download, url, ydl_opts, cached_info
             )
 
-            if self._cancelled:
+            if self._cancel_event.is_set():
                 return DownloadResult(
                     success=False,
                     error="Download cancelled",
@@ -197,34 +269,17 @@ class VideoFetcher:
 
             # ファイルパスを確認
             if download_audio_only:
-                actual_audio_path = self.download_dir / f"{video_id}.m4a"
-                if not actual_audio_path.exists():
-                    # 拡張子が異なる場合を探す
-                    for ext in ["m4a", "mp3", "opus", "webm"]:
-                        check_path = self.download_dir / f"{video_id}.{ext}"
-                        if check_path.exists():
-                            actual_audio_path = check_path
-                            break
-
                 return DownloadResult(
                     success=True,
-                    audio_path=actual_audio_path if actual_audio_path.exists() else None,
+                    audio_path=self._find_output(video_id, self._AUDIO_EXTS),
                     metadata=metadata,
                     download_time=download_time,
                 )
 
             # 動画ファイルを探す
-            actual_video_path = video_path
-            if not actual_video_path.exists():
-                for ext in ["mp4", "webm", "mkv"]:
-                    check_path = self.download_dir / f"{video_id}.{ext}"
-                    if check_path.exists():
-                        actual_video_path = check_path
-                        break
-
             return DownloadResult(
                 success=True,
-                video_path=actual_video_path if actual_video_path.exists() else None,
+                video_path=self._find_output(video_id, self._VIDEO_EXTS),
                 metadata=metadata,
                 download_time=download_time,
             )
@@ -236,18 +291,94 @@ class VideoFetcher:
                 download_time=time.time() - start_time,
             )
 
-    def _download(self, url: str, ydl_opts: dict) -> dict:
-        """yt-dlpでダウンロード（同期）."""
+    def _find_output(self, video_id: str, exts: tuple[str, ...]) -> Optional[Path]:
+        """ダウンロード先から {video_id}.{ext} を探す（extsの順で優先）.
+
+        拡張子ごとにstatせず、ディレクトリを1回だけ走査する.
+        """
+        prefix = f"{video_id}."
+        found: dict[str, str] = {}
+
+        with os.scandir(self.download_dir) as it:
+            for entry in it:
+                if entry.name.startswith(prefix):
+                    ext = entry.name[len(prefix):]
+                    if ext in exts:
+                        found[ext] = entry.path
+
+        for ext in exts:
+            if ext in found:
+                return Path(found[ext])
+        return None
+
+    async def download_many(
+        self,
+        urls: list[str],
+        max_concurrent: int = 4,
+        progress_callback: Optional[Callable[[str, float, str], None]] = None,
+        download_audio_only: bool = False,
+    ) -> list[DownloadResult]:
+        """複数の動画を並行してダウンロード.
+
+        Args:
+            urls: YouTube URLのリスト
+            max_concurrent: 同時ダウンロード数の上限
+            progress_callback: 進捗コールバック (url, progress: 0-100, status: str)
+            download_audio_only: 音声のみダウンロード
+
+        Returns:
+            URLと同じ順序のDownloadResultのリスト
+        """
+        self._cancel_event.clear()
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def download_one(url: str) -> DownloadResult:
+            # 無効なURLは同時実行枠を使わずに失敗として返す
+            if not self.is_valid_youtube_url(url):
+                return DownloadResult(success=False, error=f"Invalid YouTube URL: {url}")
+
+            async with semaphore:
+                # 待機中にキャンセルされた場合は開始しない
+                if self._cancel_event.is_set():
+                    return DownloadResult(success=False, error="Download cancelled")
+
+                callback = None
+                if progress_callback is not None:
+                    def callback(progress: float, status: str) -> None:
+                        progress_callback(url, progress, status)
+
+                return await self.download(
+                    url,
+                    progress_callback=callback,
+                    download_audio_only=download_audio_only,
+                )
+
+        return await asyncio.gather(*(download_one(url) for url in urls))
+
+    def _download(
+        self, url: str, ydl_opts: dict, info: Optional[dict] = None
+    ) -> dict:
+        """yt-dlpでダウンロード（同期）.
+
+        Args:
+            url: YouTube URL
+            ydl_opts: yt-dlpオプション
+            info: 取得済みの動画情報（あればextract_infoを省略）
+        """
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            if info is not None:
+                # キャッシュを汚さないようコピーを渡す（yt-dlpが書き換えるため）
+                return ydl.process_ie_result(copy.deepcopy(info), download=True)
             return ydl.extract_info(url, download=True)
 
     def _progress_hook(
         self,
         d: dict,
+        *,
         callback: Optional[Callable[[float, str], None]],
     ) -> None:
         """yt-dlp進捗フック."""
-        if self._cancelled:
+        if self._cancel_event.is_set():
             raise yt_dlp.utils.DownloadCancelled("Download cancelled by user")
 
         if callback is None:
@@ -276,11 +407,13 @@ class VideoFetcher:
         self, info: dict, video_id: str, url: str
     ) -> VideoMetadata:
         """yt-dlp情報からメタデータを作成."""
+        # upload_dateは "YYYYMMDD" 固定なので、strptimeを使わず直接分解
         upload_date = None
-        if info.get("upload_date"):
+        raw_date = info.get("upload_date")
+        if raw_date and len(raw_date) == 8 and raw_date.isdigit():
             try:
-                upload_date = datetime.strptime(
-                    info["upload_date"], "%Y%m%d"
+                upload_date = datetime(
+                    int(raw_date[:4]), int(raw_date[4:6]), int(raw_date[6:8])
                 )
             except ValueError:
                 pass
@@ -307,4 +440,20 @@ class VideoFetcher:
 
     def cancel(self) -> None:
         """ダウンロードをキャンセル."""
-        self._cancelled = True
+        self._cancel_event.set()
+
+    def close(self) -> None:
+        """保持しているyt-dlpのリソースを解放."""
+        self._executor.shutdown(wait=False)
+
+        with self._ydl_lock:
+            if self._ydl_info is not None:
+                self._ydl_info.close()
+                self._ydl_info = None
+
+    async def __aenter__(self) -> "VideoFetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """ブロックを抜けるとき（例外時も含む）にリソースを解放."""
+        self.close()
@@ -9,6 +9,7 @@ CustomTkinterは組み込みのアニメーションを持たないため、
 after()メソッドを使って手動でアニメーションを実装する。
 """
 
+from functools import lru_cache
 from typing import Callable, Any, Optional
 import math
 
@@ -112,6 +113,9 @@ class Animator:
         )
     """
 
+    # これ以下のフレーム数なら全フレームの値を事前計算する
+    MAX_PRECOMPUTED_FRAMES = 512
+
     def __init__(self, widget):
         """
         Args:
@@ -159,6 +163,20 @@ class Animator:
         frame_duration = 1000 // fps
         total_frames = max(1, duration // frame_duration)
         current_frame = 0
+        delta = end - start
+
+        if total_frames <= self.MAX_PRECOMPUTED_FRAMES:
+            # 各フレームの値を事前に計算しておき、フレームごとは参照のみ
+            values = tuple(
+                start + delta * easing(frame / total_frames)
+                for frame in range(total_frames + 1)
+            )
+            value_at = values.__getitem__
+        else:
+            def value_at(frame: int) -> float:
+                return start + delta * easing(min(1.0, frame / total_frames))
+
+        after = self.widget.after
 
         def update():
             nonlocal current_frame
@@ -166,12 +184,8 @@ class Animator:
             if not self._is_animating:
                 return
 
-            progress = current_frame / total_frames
-            eased_progress = easing(min(1.0, progress))
-            current_value = start + (end - start) * eased_progress
-
             try:
-                on_update(current_value)
+                on_update(value_at(current_frame))
             except Exception:
                 self.stop()
                 return
@@ -179,7 +193,7 @@ class Animator:
             current_frame += 1
 
             if current_frame <= total_frames:
-                self._animation_id = self.widget.after(frame_duration, update)
+                self._animation_id = after(frame_duration, update)
             else:
                 self._is_animating = False
                 if on_complete:
@@ -198,12 +212,6 @@ class Animator:
         Note: CustomTkinterは直接的な透明度制御をサポートしていないため、
               背景色のアルファ値や見える/見えないの切り替えで近似する。
         """
-        # 簡易的な実装: ウィジェットを表示
-        try:
-            self.widget.configure(fg_color=self.widget.cget("fg_color"))
-        except Exception:
-            pass
-
         if on_complete:
             self.widget.after(duration, on_complete)
 
@@ -287,6 +295,22 @@ class Animator:
                 on_complete()
 
 
+# 0-255 に対応する2桁の16進文字列
+_HEX_BYTE = tuple(f"{i:02x}" for i in range(256))
+
+
+@lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color: str) -> tuple:
+    """#RRGGBB を (r, g, b) に変換（テーマ色は数が限られるのでキャッシュ）"""
+    hex_color = hex_color.lstrip("#")
+    return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+
+
+def _rgb_to_hex(r: int, g: int, b: int) -> str:
+    """(r, g, b) を #rrggbb に変換（各値は0-255）"""
+    return f"#{_HEX_BYTE[r]}{_HEX_BYTE[g]}{_HEX_BYTE[b]}"
+
+
 def animate_color_transition(
     widget,
     property_name: str,
@@ -306,28 +330,19 @@ def animate_color_transition(
         duration: アニメーション時間 (ミリ秒)
     """
 
-    def hex_to_rgb(hex_color: str) -> tuple:
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-
-    def rgb_to_hex(rgb: tuple) -> str:
-        return "#{:02x}{:02x}{:02x}".format(
-            max(0, min(255, int(rgb[0]))),
-            max(0, min(255, int(rgb[1]))),
-            max(0, min(255, int(rgb[2]))),
-        )
-
-    start_rgb = hex_to_rgb(start_color)
-    end_rgb = hex_to_rgb(end_color)
+    # 差分はフレームごとに計算せず、最初に一度だけ求める
+    r0, g0, b0 = _hex_to_rgb(start_color)
+    r1, g1, b1 = _hex_to_rgb(end_color)
+    dr, dg, db = r1 - r0, g1 - g0, b1 - b0
 
     animator = Animator(widget)
 
     def update_color(progress: float):
-        current_rgb = tuple(
-            start_rgb[i] + (end_rgb[i] - start_rgb[i]) * progress for i in range(3)
-        )
+        r = max(0, min(255, int(r0 + dr * progress)))
+        g = max(0, min(255, int(g0 + dg * progress)))
+        b = max(0, min(255, int(b0 + db * progress)))
         try:
-            widget.configure(**{property_name: rgb_to_hex(current_rgb)})
+            widget.configure(**{property_name: _rgb_to_hex(r, g, b)})
         except Exception:
             pass
 
@@ -361,21 +376,29 @@ def create_hover_effect(
     """
     current_animator: Optional[Animator] = None
 
-    def on_enter(event):
+    def transition(start_color: str, end_color: str):
         nonlocal current_animator
         if current_animator:
             current_animator.stop()
+            current_animator = None
+
+        # 表示されていないウィジェットはアニメーションせず最終色にする
+        if duration <= 0 or not widget.winfo_viewable():
+            try:
+                widget.configure(**{property_name: end_color})
+            except Exception:
+                pass
+            return
+
         current_animator = animate_color_transition(
-            widget, property_name, normal_color, hover_color, duration
+            widget, property_name, start_color, end_color, duration
         )
 
+    def on_enter(event):
+        transition(normal_color, hover_color)
+
     def on_leave(event):
-        nonlocal current_animator
-        if current_animator:
-            current_animator.stop()
-        current_animator = animate_color_transition(
-            widget, property_name, hover_color, normal_color, duration
-        )
+        transition(hover_color, normal_color)
 
     widget.bind("<Enter>", on_enter)
     widget.bind("<Leave>", on_leave)
@@ -6,13 +6,44 @@ CustomTkinterベースのデスクトップアプリケーション。
 """
 
 import asyncio
+import logging
+import sys
 import threading
+import time
 from pathlib import Path
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Optional, Callable
 
 import customtkinter as ctk
 
 from .theme import apply_nani_theme, COLORS, SPACING, NaniTheme
+from . import views
+
+if TYPE_CHECKING:
+    from src.core import OllamaClient, Transcriber
+    from src.models import TranscriptionResult
+
+logger = logging.getLogger(__name__)
+
+# ビュー名 -> ビュークラス名（views から初回表示時に読み込む）
+_VIEW_CLASS_NAMES = {
+    "home": "HomeView",
+    "processing": "ProcessingView",
+    "settings": "SettingsView",
+    "result": "ResultView",
+    "editor": "EditorView",
+}
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """イベントループを生成（uvloop / winloop があれば使用）."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return asyncio.new_event_loop()
+    return loop_impl.new_event_loop()
 
 
 class App(ctk.CTk):
@@ -24,6 +55,12 @@ class App(ctk.CTk):
     MIN_WIDTH = 900
     MIN_HEIGHT = 600
 
+    # 使われなくなった文字起こしモデルを解放するまでの時間（秒）
+    TRANSCRIBER_IDLE_SECONDS = 600.0
+
+    # Ollamaが利用可能だった結果を使い回す時間（秒）
+    OLLAMA_AVAILABLE_TTL = 30.0
+
     def __init__(self) -> None:
         """アプリケーションを初期化."""
         super().__init__()
@@ -47,12 +84,25 @@ class App(ctk.CTk):
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._loop_thread: Optional[threading.Thread] = None
 
+        # 文字起こし（モデルを処理間で使い回す）
+        # これらはイベントループのスレッドからのみ操作する（Tkの呼び出しは行わない）
+        self._transcriber: Optional["Transcriber"] = None
+        self._transcriber_release_handle: Optional[asyncio.TimerHandle] = None
+        # 文字起こしの実行中（キャンセル後にスレッドが残っている間も含む）は保持される
+        self._transcribe_lock = asyncio.Lock()
+
+        # ホストごとの「Ollamaが利用可能」と確認できた時刻（time.monotonic）
+        self._ollama_checked_at: dict = {}
+
         # UIを構築
         self._setup_ui()
 
         # 非同期ループを開始
         self._start_async_loop()
 
+        # 処理で使う重いモジュールを裏で読み込んでおく
+        self._start_core_preload()
+
         # 初期ビューを表示
         self.show_view("home")
 
@@ -72,13 +122,30 @@ class App(ctk.CTk):
     def _start_async_loop(self) -> None:
         """非同期イベントループを開始."""
         def run_loop():
-            self._loop = asyncio.new_event_loop()
+            self._loop = _new_event_loop()
             asyncio.set_event_loop(self._loop)
             self._loop.run_forever()
 
         self._loop_thread = threading.Thread(target=run_loop, daemon=True)
         self._loop_thread.start()
 
+    def _start_core_preload(self) -> None:
+        """コアモジュールの読み込みをバックグラウンドで開始.
+
+        src.core は whisper / torch などを読み込むため初回の import が重い。
+        URL入力中に読み込んでおくと、処理開始時の import は読み込み済みの
+        モジュールを参照するだけになる。
+        """
+        def preload():
+            try:
+                import src.core  # noqa: F401
+                import src.models  # noqa: F401
+            except Exception:
+                # 処理開始時にあらためて import され、そこでエラーとして表示される
+                logger.warning("コアモジュールの事前読み込みに失敗しました", exc_info=True)
+
+        threading.Thread(target=preload, daemon=True).start()
+
     def run_async(self, coro) -> asyncio.Future:
         """非同期タスクを実行.
 
@@ -92,6 +159,92 @@ class App(ctk.CTk):
             raise RuntimeError("Event loop not started")
         return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
+    def get_transcriber(self) -> "Transcriber":
+        """共有の文字起こしインスタンスを取得（イベントループ上で呼ぶ）.
+
+        読み込んだモデルは処理間で使い回す。使い終わったら release_transcriber_later() を呼ぶ。
+        """
+        self._cancel_transcriber_release()
+        if self._transcriber is None:
+            from src.core import Transcriber
+
+            self._transcriber = Transcriber()
+        return self._transcriber
+
+    async def transcribe(
+        self,
+        audio_path: Path,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ) -> "TranscriptionResult":
+        """共有の文字起こしモデルで文字起こし（イベントループ上で呼ぶ）.
+
+        待機中にキャンセルされても、スレッドで実行中の文字起こしは止まらない。
+        同じモデルを同時に使わないよう、前の文字起こしが本当に終わるまで次を始めない。
+        """
+        transcriber = self.get_transcriber()
+        await self._transcribe_lock.acquire()
+
+        task = asyncio.ensure_future(
+            transcriber.transcribe(audio_path, progress_callback=progress_callback)
+        )
+        task.add_done_callback(self._on_transcribe_done)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 実行中の文字起こしスレッドにも中断を伝える（ロックは終了時に解放される）
+            transcriber.cancel()
+            raise
+
+    def _on_transcribe_done(self, task: asyncio.Future) -> None:
+        """文字起こしタスクの終了時（キャンセル後に残ったスレッドの終了も含む）."""
+        self._transcribe_lock.release()
+        if not task.cancelled():
+            # 呼び出し元がキャンセル済みの場合も例外を回収しておく
+            task.exception()
+        self.release_transcriber_later()
+
+    def release_transcriber_later(self) -> None:
+        """TRANSCRIBER_IDLE_SECONDS の間使われなければ文字起こしモデルを解放する（イベントループ上で呼ぶ）."""
+        self._cancel_transcriber_release()
+        self._transcriber_release_handle = self._loop.call_later(
+            self.TRANSCRIBER_IDLE_SECONDS,
+            self._release_transcriber,
+        )
+
+    def _cancel_transcriber_release(self) -> None:
+        """予約済みのモデル解放を取り消す."""
+        if self._transcriber_release_handle is not None:
+            self._transcriber_release_handle.cancel()
+            self._transcriber_release_handle = None
+
+    def _release_transcriber(self) -> None:
+        """文字起こしモデルを解放."""
+        self._transcriber_release_handle = None
+        # 文字起こし中なら解放しない（終了時に改めて予約される）
+        if self._transcribe_lock.locked():
+            return
+        if self._transcriber is not None:
+            self._transcriber.unload_model()
+
+    async def ollama_available(self, client: "OllamaClient") -> bool:
+        """Ollamaが利用可能かどうか（イベントループ上で呼ぶ）.
+
+        利用可能だった結果は OLLAMA_AVAILABLE_TTL 秒の間使い回し、
+        続けて処理する場合の接続確認を省く。利用できなかった場合は
+        すぐに起動されることもあるため、毎回確認する。
+        """
+        checked_at = self._ollama_checked_at.get(client.host)
+        now = time.monotonic()
+        if checked_at is not None and now - checked_at < self.OLLAMA_AVAILABLE_TTL:
+            return True
+
+        if await client.is_available():
+            self._ollama_checked_at[client.host] = time.monotonic()
+            return True
+
+        self._ollama_checked_at.pop(client.host, None)
+        return False
+
     def show_view(self, view_name: str, **kwargs) -> None:
         """ビューを表示.
 
@@ -100,8 +253,11 @@ class App(ctk.CTk):
             **kwargs: ビューに渡す引数
         """
         # 既存のビューを非表示
-        if self._current_view is not None:
-            self._current_view.grid_forget()
+        current = self._current_view
+        if current is not None:
+            if not getattr(current.on_hide, "_is_noop", False):
+                current.on_hide()
+            current.grid_forget()
 
         # ビューを取得または作成
         if view_name not in self._views:
@@ -110,7 +266,7 @@ class App(ctk.CTk):
         view = self._views[view_name]
 
         # ビューを初期化（必要に応じて）
-        if hasattr(view, "on_show"):
+        if not getattr(view.on_show, "_is_noop", False):
             view.on_show(**kwargs)
 
         # ビューを表示
@@ -126,26 +282,12 @@ class App(ctk.CTk):
         Returns:
             作成したビュー
         """
-        from .views import (
-            HomeView,
-            ProcessingView,
-            SettingsView,
-            ResultView,
-            EditorView,
-        )
-
-        view_classes = {
-            "home": HomeView,
-            "processing": ProcessingView,
-            "settings": SettingsView,
-            "result": ResultView,
-            "editor": EditorView,
-        }
-
-        view_class = view_classes.get(view_name)
-        if view_class is None:
+        class_name = _VIEW_CLASS_NAMES.get(view_name)
+        if class_name is None:
             raise ValueError(f"Unknown view: {view_name}")
 
+        view_class = getattr(views, class_name)
+
         return view_class(self._main_container, app=self)
 
     def on_closing(self) -> None:
@@ -7,11 +7,14 @@ nani.now のデザインからインスパイアされたデザインシステ
 柔らかな角丸と軽やかな影で、モダンで親しみやすい印象を演出。
 """
 
-from dataclasses import dataclass
-from typing import Tuple
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorPalette:
     """
     Nani-inspired カラーパレット
@@ -81,8 +84,13 @@ class ColorPalette:
     DARK_TEXT_SECONDARY: str = "#99A2A7"
     DARK_BORDER: str = "#2A3540"       # ダークモードボーダー
 
+    def __post_init__(self) -> None:
+        # 色文字列は CustomTkinter 内部で辞書キーや比較に使われるため intern しておく
+        for f in fields(self):
+            object.__setattr__(self, f.name, sys.intern(getattr(self, f.name)))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Typography:
     """
     タイポグラフィ設定
@@ -118,7 +126,7 @@ class Typography:
     LINE_HEIGHT_RELAXED: float = 1.75
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spacing:
     """
     スペーシングシステム
@@ -152,7 +160,7 @@ class Spacing:
     GAP_XL: int = 24
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BorderRadius:
     """
     角丸設定
@@ -172,7 +180,7 @@ class BorderRadius:
     CIRCLE: str = "50%"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Shadows:
     """
     シャドウ設定
@@ -187,15 +195,15 @@ class Shadows:
     # シャドウの色 (参考)
     SHADOW_COLOR: str = "#001428"
 
-    # シャドウ定義 (CSS形式 - 参考用)
-    XS: str = "0 2px 3px -1.5px rgba(0, 20, 40, 0.05)"
-    SM: str = "0 2px 5px -2px rgba(0, 20, 40, 0.08)"
-    MD: str = "0 2px 8px -1px rgba(0, 20, 40, 0.07)"
-    LG: str = "0 6px 14px 0 rgba(0, 20, 40, 0.08)"
-    XL: str = "0 0 18px 0 rgba(0, 20, 40, 0.13)"
+    # シャドウ定義 (CSS形式 - 参考用、実行時には使わないためコメントのみ)
+    # XS: 0 2px 3px -1.5px rgba(0, 20, 40, 0.05)
+    # SM: 0 2px 5px -2px rgba(0, 20, 40, 0.08)
+    # MD: 0 2px 8px -1px rgba(0, 20, 40, 0.07)
+    # LG: 0 6px 14px 0 rgba(0, 20, 40, 0.08)
+    # XL: 0 0 18px 0 rgba(0, 20, 40, 0.13)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Animation:
     """
     アニメーション設定
@@ -225,6 +233,9 @@ class Animation:
 class NaniTheme:
     """
     Nani-inspired テーマをCustomTkinterに適用するためのユーティリティクラス
+
+    スタイルは import 時またはキャッシュで一度だけ生成し、毎回同じオブジェクトを返す。
+    返り値は共有されるため、読み取り専用の MappingProxyType で返す。
     """
 
     colors = ColorPalette()
@@ -235,80 +246,52 @@ class NaniTheme:
     animation = Animation()
 
     @classmethod
-    def get_button_style(cls, variant: str = "primary") -> dict:
+    def get_button_style(cls, variant: str = "primary") -> Mapping[str, Any]:
         """
         ボタンスタイルを取得
 
         Args:
             variant: "primary", "secondary", "outline", "ghost", "danger"
         """
-        styles = {
-            "primary": {
-                "fg_color": cls.colors.PRIMARY,
-                "hover_color": cls.colors.PRIMARY_DARK,
-                "text_color": cls.colors.TEXT_ON_PRIMARY,
-                "corner_radius": cls.radius.MD,
-            },
-            "secondary": {
-                "fg_color": cls.colors.BG_SECONDARY,
-                "hover_color": cls.colors.BG_HOVER,
-                "text_color": cls.colors.TEXT_PRIMARY,
-                "corner_radius": cls.radius.MD,
-            },
-            "outline": {
-                "fg_color": "transparent",
-                "hover_color": cls.colors.PRIMARY_BG,
-                "text_color": cls.colors.PRIMARY,
-                "border_width": 1,
-                "border_color": cls.colors.PRIMARY,
-                "corner_radius": cls.radius.MD,
-            },
-            "ghost": {
-                "fg_color": "transparent",
-                "hover_color": cls.colors.BG_HOVER,
-                "text_color": cls.colors.TEXT_PRIMARY,
-                "corner_radius": cls.radius.MD,
-            },
-            "danger": {
-                "fg_color": cls.colors.DANGER,
-                "hover_color": cls.colors.DANGER_DARK,
-                "text_color": cls.colors.TEXT_ON_PRIMARY,
-                "corner_radius": cls.radius.MD,
-            },
-        }
-        return styles.get(variant, styles["primary"])
+        return _BUTTON_STYLES.get(variant, _DEFAULT_BUTTON_STYLE)
 
     @classmethod
-    def get_input_style(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_input_style(cls) -> Mapping[str, Any]:
         """入力フィールドのスタイル"""
-        return {
-            "fg_color": cls.colors.BG_MAIN,
-            "border_color": cls.colors.BORDER_DEFAULT,
-            "text_color": cls.colors.TEXT_PRIMARY,
-            "placeholder_text_color": cls.colors.TEXT_PLACEHOLDER,
-            "corner_radius": cls.radius.MD,
+        colors, radius = cls.colors, cls.radius
+        return MappingProxyType({
+            "fg_color": colors.BG_MAIN,
+            "border_color": colors.BORDER_DEFAULT,
+            "text_color": colors.TEXT_PRIMARY,
+            "placeholder_text_color": colors.TEXT_PLACEHOLDER,
+            "corner_radius": radius.MD,
             "border_width": 1,
-        }
+        })
 
     @classmethod
-    def get_card_style(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_card_style(cls) -> Mapping[str, Any]:
         """カードのスタイル"""
-        return {
-            "fg_color": cls.colors.BG_CARD,
-            "corner_radius": cls.radius.LG,
+        colors, radius = cls.colors, cls.radius
+        return MappingProxyType({
+            "fg_color": colors.BG_CARD,
+            "corner_radius": radius.LG,
             "border_width": 1,
-            "border_color": cls.colors.BORDER_LIGHT,
-        }
+            "border_color": colors.BORDER_LIGHT,
+        })
 
     @classmethod
-    def get_sidebar_style(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_sidebar_style(cls) -> Mapping[str, Any]:
         """サイドバーのスタイル"""
-        return {
+        return MappingProxyType({
             "fg_color": cls.colors.BG_SIDEBAR,
             "corner_radius": 0,
-        }
+        })
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_font(cls, size: str = "base", weight: str = "normal") -> tuple:
         """
         フォント設定を取得
@@ -317,122 +300,44 @@ class NaniTheme:
             size: "xs", "sm", "base", "md", "lg", "xl", "2xl", "3xl", "4xl"
             weight: "normal", "bold"
         """
-        size_map = {
-            "xs": cls.typography.SIZE_XS,
-            "sm": cls.typography.SIZE_SM,
-            "base": cls.typography.SIZE_BASE,
-            "md": cls.typography.SIZE_MD,
-            "lg": cls.typography.SIZE_LG,
-            "xl": cls.typography.SIZE_XL,
-            "2xl": cls.typography.SIZE_2XL,
-            "3xl": cls.typography.SIZE_3XL,
-            "4xl": cls.typography.SIZE_4XL,
-        }
-        font_size = size_map.get(size, cls.typography.SIZE_BASE)
-        font_weight = weight if weight in ("normal", "bold") else "normal"
-
-        return (cls.typography.FONT_FAMILY_PRIMARY, font_size, font_weight)
+        typography = cls.typography
+        font_size = _FONT_SIZE_MAP.get(size, typography.SIZE_BASE)
+        font_weight = weight if weight in _FONT_WEIGHTS else "normal"
+
+        return (typography.FONT_FAMILY_PRIMARY, font_size, font_weight)
 
     @classmethod
-    def get_label_style(cls, variant: str = "default") -> dict:
+    def get_label_style(cls, variant: str = "default") -> Mapping[str, Any]:
         """ラベルのスタイル"""
-        styles = {
-            "default": {
-                "text_color": cls.colors.TEXT_PRIMARY,
-                "font": cls.get_font("base"),
-            },
-            "secondary": {
-                "text_color": cls.colors.TEXT_SECONDARY,
-                "font": cls.get_font("sm"),
-            },
-            "muted": {
-                "text_color": cls.colors.TEXT_MUTED,
-                "font": cls.get_font("sm"),
-            },
-            "caption": {
-                "text_color": cls.colors.TEXT_MUTED,
-                "font": cls.get_font("xs"),
-            },
-            "subtitle": {
-                "text_color": cls.colors.TEXT_PRIMARY,
-                "font": cls.get_font("md", "bold"),
-            },
-            "heading": {
-                "text_color": cls.colors.TEXT_PRIMARY,
-                "font": cls.get_font("xl", "bold"),
-            },
-            "title": {
-                "text_color": cls.colors.TEXT_PRIMARY,
-                "font": cls.get_font("2xl", "bold"),
-            },
-        }
-        return styles.get(variant, styles["default"])
+        return _LABEL_STYLES.get(variant, _DEFAULT_LABEL_STYLE)
 
     @classmethod
-    def get_progress_style(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_progress_style(cls) -> Mapping[str, Any]:
         """プログレスバーのスタイル"""
-        return {
-            "fg_color": cls.colors.BG_SECONDARY,
-            "progress_color": cls.colors.PRIMARY,
-            "corner_radius": cls.radius.PILL,
-        }
+        colors, radius = cls.colors, cls.radius
+        return MappingProxyType({
+            "fg_color": colors.BG_SECONDARY,
+            "progress_color": colors.PRIMARY,
+            "corner_radius": radius.PILL,
+        })
 
     @classmethod
-    def get_switch_style(cls) -> dict:
+    @lru_cache(maxsize=None)
+    def get_switch_style(cls) -> Mapping[str, Any]:
         """スイッチのスタイル"""
-        return {
-            "fg_color": cls.colors.BORDER_DARK,
-            "progress_color": cls.colors.PRIMARY,
-            "button_color": cls.colors.BG_MAIN,
-            "button_hover_color": cls.colors.BG_SECONDARY,
-        }
+        colors = cls.colors
+        return MappingProxyType({
+            "fg_color": colors.BORDER_DARK,
+            "progress_color": colors.PRIMARY,
+            "button_color": colors.BG_MAIN,
+            "button_hover_color": colors.BG_SECONDARY,
+        })
 
     @classmethod
-    def get_tag_style(cls, variant: str = "default") -> dict:
+    def get_tag_style(cls, variant: str = "default") -> Mapping[str, Any]:
         """タグ/バッジのスタイル"""
-        styles = {
-            "default": {
-                "fg_color": cls.colors.BG_SECONDARY,
-                "text_color": cls.colors.TEXT_SECONDARY,
-                "corner_radius": cls.radius.SM,
-            },
-            "primary": {
-                "fg_color": cls.colors.PRIMARY_BG,
-                "text_color": cls.colors.PRIMARY_DARK,
-                "corner_radius": cls.radius.SM,
-            },
-            "success": {
-                "fg_color": cls.colors.SUCCESS_BG,
-                "text_color": cls.colors.SUCCESS,
-                "corner_radius": cls.radius.SM,
-            },
-            "warning": {
-                "fg_color": cls.colors.WARNING_BG,
-                "text_color": cls.colors.WARNING,
-                "corner_radius": cls.radius.SM,
-            },
-            "danger": {
-                "fg_color": cls.colors.DANGER_BG,
-                "text_color": cls.colors.DANGER,
-                "corner_radius": cls.radius.SM,
-            },
-            "wip": {
-                "fg_color": cls.colors.ACCENT_ORANGE_BG,
-                "text_color": cls.colors.ACCENT_ORANGE,
-                "corner_radius": cls.radius.SM,
-            },
-            "beta": {
-                "fg_color": "#F3F0FF",
-                "text_color": cls.colors.ACCENT_PURPLE,
-                "corner_radius": cls.radius.SM,
-            },
-            "done": {
-                "fg_color": cls.colors.SUCCESS_BG,
-                "text_color": cls.colors.SUCCESS,
-                "corner_radius": cls.radius.SM,
-            },
-        }
-        return styles.get(variant, styles["default"])
+        return _TAG_STYLES.get(variant, _DEFAULT_TAG_STYLE)
 
 
 # === Quick Access Shortcuts ===
@@ -441,6 +346,142 @@ TYPOGRAPHY = NaniTheme.typography
 SPACING = NaniTheme.spacing
 RADIUS = NaniTheme.radius
 
+# get_font() のサイズ名 → px 対応表
+_FONT_SIZE_MAP = {
+    "xs": TYPOGRAPHY.SIZE_XS,
+    "sm": TYPOGRAPHY.SIZE_SM,
+    "base": TYPOGRAPHY.SIZE_BASE,
+    "md": TYPOGRAPHY.SIZE_MD,
+    "lg": TYPOGRAPHY.SIZE_LG,
+    "xl": TYPOGRAPHY.SIZE_XL,
+    "2xl": TYPOGRAPHY.SIZE_2XL,
+    "3xl": TYPOGRAPHY.SIZE_3XL,
+    "4xl": TYPOGRAPHY.SIZE_4XL,
+}
+_FONT_WEIGHTS = frozenset({"normal", "bold"})
+
+# ボタンスタイル（variant → スタイル）
+_BUTTON_STYLES = {
+    "primary": {
+        "fg_color": COLORS.PRIMARY,
+        "hover_color": COLORS.PRIMARY_DARK,
+        "text_color": COLORS.TEXT_ON_PRIMARY,
+        "corner_radius": RADIUS.MD,
+    },
+    "secondary": {
+        "fg_color": COLORS.BG_SECONDARY,
+        "hover_color": COLORS.BG_HOVER,
+        "text_color": COLORS.TEXT_PRIMARY,
+        "corner_radius": RADIUS.MD,
+    },
+    "outline": {
+        "fg_color": "transparent",
+        "hover_color": COLORS.PRIMARY_BG,
+        "text_color": COLORS.PRIMARY,
+        "border_width": 1,
+        "border_color": COLORS.PRIMARY,
+        "corner_radius": RADIUS.MD,
+    },
+    "ghost": {
+        "fg_color": "transparent",
+        "hover_color": COLORS.BG_HOVER,
+        "text_color": COLORS.TEXT_PRIMARY,
+        "corner_radius": RADIUS.MD,
+    },
+    "danger": {
+        "fg_color": COLORS.DANGER,
+        "hover_color": COLORS.DANGER_DARK,
+        "text_color": COLORS.TEXT_ON_PRIMARY,
+        "corner_radius": RADIUS.MD,
+    },
+}
+_BUTTON_STYLES = {k: MappingProxyType(v) for k, v in _BUTTON_STYLES.items()}
+_DEFAULT_BUTTON_STYLE = _BUTTON_STYLES["primary"]
+
+# ラベルスタイル（variant → スタイル）
+_LABEL_STYLES = {
+    "default": {
+        "text_color": COLORS.TEXT_PRIMARY,
+        "font": NaniTheme.get_font("base"),
+    },
+    "secondary": {
+        "text_color": COLORS.TEXT_SECONDARY,
+        "font": NaniTheme.get_font("sm"),
+    },
+    "muted": {
+        "text_color": COLORS.TEXT_MUTED,
+        "font": NaniTheme.get_font("sm"),
+    },
+    "caption": {
+        "text_color": COLORS.TEXT_MUTED,
+        "font": NaniTheme.get_font("xs"),
+    },
+    "subtitle": {
+        "text_color": COLORS.TEXT_PRIMARY,
+        "font": NaniTheme.get_font("md", "bold"),
+    },
+    "heading": {
+        "text_color": COLORS.TEXT_PRIMARY,
+        "font": NaniTheme.get_font("xl", "bold"),
+    },
+    "title": {
+        "text_color": COLORS.TEXT_PRIMARY,
+        "font": NaniTheme.get_font("2xl", "bold"),
+    },
+}
+_LABEL_STYLES = {k: MappingProxyType(v) for k, v in _LABEL_STYLES.items()}
+_DEFAULT_LABEL_STYLE = _LABEL_STYLES["default"]
+
+# タグ/バッジスタイル（variant → スタイル）
+_TAG_STYLES = {
+    "default": {
+        "fg_color": COLORS.BG_SECONDARY,
+        "text_color": COLORS.TEXT_SECONDARY,
+        "corner_radius": RADIUS.SM,
+    },
+    "primary": {
+        "fg_color": COLORS.PRIMARY_BG,
+        "text_color": COLORS.PRIMARY_DARK,
+        "corner_radius": RADIUS.SM,
+    },
+    "success": {
+        "fg_color": COLORS.SUCCESS_BG,
+        "text_color": COLORS.SUCCESS,
+        "corner_radius": RADIUS.SM,
+    },
+    "warning": {
+        "fg_color": COLORS.WARNING_BG,
+        "text_color": COLORS.WARNING,
+        "corner_radius": RADIUS.SM,
+    },
+    "danger": {
+        "fg_color": COLORS.DANGER_BG,
+        "text_color": COLORS.DANGER,
+        "corner_radius": RADIUS.SM,
+    },
+    "wip": {
+        "fg_color": COLORS.ACCENT_ORANGE_BG,
+        "text_color": COLORS.ACCENT_ORANGE,
+        "corner_radius": RADIUS.SM,
+    },
+    "beta": {
+        "fg_color": "#F3F0FF",
+        "text_color": COLORS.ACCENT_PURPLE,
+        "corner_radius": RADIUS.SM,
+    },
+    "done": {
+        "fg_color": COLORS.SUCCESS_BG,
+        "text_color": COLORS.SUCCESS,
+        "corner_radius": RADIUS.SM,
+    },
+}
+_TAG_STYLES = {k: MappingProxyType(v) for k, v in _TAG_STYLES.items()}
+_DEFAULT_TAG_STYLE = _TAG_STYLES["default"]
+
+
+# apply_nani_theme() を適用済みかどうか
+_THEME_APPLIED = False
+
 
 def apply_nani_theme():
     """
@@ -454,7 +495,13 @@ def apply_nani_theme():
 
         app = ctk.CTk()
         ...
+
+    2回目以降の呼び出しは何もしない。
     """
+    global _THEME_APPLIED
+    if _THEME_APPLIED:
+        return
+
     import customtkinter as ctk
 
     # アピアランスモードの設定
@@ -466,4 +513,4 @@ def apply_nani_theme():
 
     # JSONテーマファイルを使う方法もあるが、
     # より柔軟な制御のため、このモジュールの関数を使ってスタイルを適用することを推奨
-    pass
+    _THEME_APPLIED = True
@@ -1,10 +1,37 @@
-"""ビューモジュール."""
+"""ビューモジュール.
+
+BaseView 以外のビューは初回アクセス時に読み込む（起動時間短縮のため）。
+"""
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseView
-from .home import HomeView
-from .processing import ProcessingView
-from .settings import SettingsView
-from .result import ResultView
-from .editor import EditorView
+
+if TYPE_CHECKING:
+    from .editor import EditorView
+    from .home import HomeView
+    from .processing import ProcessingView
+    from .result import ResultView
+    from .settings import SettingsView
+
+# クラス名 -> 定義モジュール
+_LAZY_VIEWS = {
+    "HomeView": ".home",
+    "ProcessingView": ".processing",
+    "SettingsView": ".settings",
+    "ResultView": ".result",
+    "EditorView": ".editor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_VIEWS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BaseView",
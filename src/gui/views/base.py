@@ -9,14 +9,23 @@ from typing import TYPE_CHECKING, Any, Optional
 
 import customtkinter as ctk
 
-from ..theme import COLORS, SPACING, NaniTheme
+from ..theme import COLORS, RADIUS, SPACING, NaniTheme
 
 if TYPE_CHECKING:
     from ..app import App
 
 
 class BaseView(ctk.CTkFrame):
-    """ベースビュークラス."""
+    """ベースビュークラス.
+
+    サブクラスは ``self._colors.BG_MAIN`` や ``self._theme.get_button_style("primary")``
+    のようにクラス属性経由でテーマを参照できる。
+    """
+
+    _colors = COLORS
+    _spacing = SPACING
+    _radius = RADIUS
+    _theme = NaniTheme
 
     def __init__(
         self,
@@ -32,7 +41,7 @@ class BaseView(ctk.CTkFrame):
         """
         super().__init__(
             master,
-            fg_color=COLORS.BG_MAIN,
+            fg_color=self._colors.BG_MAIN,
             **kwargs,
         )
         self.app = app
@@ -50,6 +59,10 @@ class BaseView(ctk.CTkFrame):
         """ビュー非表示時に呼ばれる（サブクラスでオーバーライド）."""
         pass
 
+    # オーバーライドされていないフックは App.show_view が呼び出しを省略する
+    on_show._is_noop = True
+    on_hide._is_noop = True
+
     def navigate_to(self, view_name: str, **kwargs) -> None:
         """他のビューへ遷移.
 
@@ -5,12 +5,18 @@
 動画プレビュー + タイムライン + 字幕編集を統合した編集画面。
 """
 
+import hashlib
+import os
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Dict, Optional, List
 
 import customtkinter as ctk
+import numpy as np
 import pysubs2
 
+from src.config import get_app_dir
+
 from ..theme import COLORS, SPACING, NaniTheme
 from ..widgets import (
     NaniButton,
@@ -25,18 +31,143 @@ if TYPE_CHECKING:
     from ..app import App
 
 
+# 動画ファイルの拡張子（優先順）
+_VIDEO_EXTENSIONS = (".mp4", ".webm", ".mkv", ".avi", ".mov")
+
+# 字幕ファイル -> 見つかった動画ファイル
+_VIDEO_PATH_CACHE: Dict[Path, Path] = {}
+
+
+def _scan_video_file(directory: Path, stem: Optional[str] = None) -> Optional[Path]:
+    """ディレクトリを1回だけ走査し、拡張子の優先順で最初の動画ファイルを返す.
+
+    Args:
+        directory: 探すディレクトリ
+        stem: 指定した場合はファイル名（拡張子なし）が一致するものだけを対象にする
+    """
+    found: Dict[str, Path] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext not in _VIDEO_EXTENSIONS or ext in found:
+                    continue
+                if stem is not None and name != stem:
+                    continue
+                if entry.is_file():
+                    found[ext] = Path(entry.path)
+    except OSError:
+        return None
+
+    for ext in _VIDEO_EXTENSIONS:
+        if ext in found:
+            return found[ext]
+    return None
+
+
+def _subtitle_cache_key(path: Path) -> tuple[str, str]:
+    """字幕ファイルのキャッシュキー（パスのハッシュ, 更新日時とサイズ）."""
+    stat = path.stat()
+    path_hash = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return path_hash, f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _subtitle_cache_dir() -> Path:
+    """字幕の解析結果キャッシュを置くディレクトリ."""
+    return get_app_dir() / "cache" / "subtitles"
+
+
+def _load_subtitle_cache(path: Path) -> Optional[pysubs2.SSAFile]:
+    """キャッシュが字幕ファイルと一致していれば、キャッシュから読み込む."""
+    try:
+        path_hash, version = _subtitle_cache_key(path)
+        cache_file = _subtitle_cache_dir() / f"{path_hash}-{version}.json"
+        subs = pysubs2.SSAFile.from_string(
+            cache_file.read_text(encoding="utf-8"), format_="json"
+        )
+        # JSONからはalignmentがintで戻るため、通常の解析結果と同じ列挙型に戻す
+        for style in subs.styles.values():
+            style.alignment = pysubs2.Alignment(style.alignment)
+        return subs
+    except Exception:
+        return None
+
+
+def _write_subtitle_cache(path: Path, subs_json: str) -> None:
+    """字幕ファイルの現在の内容（pysubs2のJSON形式）をキャッシュに書き出す（失敗しても無視）."""
+    try:
+        path_hash, version = _subtitle_cache_key(path)
+        cache_dir = _subtitle_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file = cache_dir / f"{path_hash}-{version}.json"
+
+        # 同じ字幕ファイルの古いキャッシュは使われないので削除
+        for old_file in cache_dir.glob(f"{path_hash}-*.json"):
+            if old_file != cache_file:
+                old_file.unlink(missing_ok=True)
+
+        cache_file.write_text(subs_json, encoding="utf-8")
+    except Exception:
+        pass
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """一時ファイルに書き出してから置き換える（途中で失敗しても元ファイルは壊れない）."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class EditorView(BaseView):
     """字幕編集ビュー（動画編集モード）."""
 
+    # テキスト・タイミング編集から動画プレイヤーへの字幕反映を遅延させる時間（ミリ秒）
+    SUBTITLE_UPDATE_DELAY_MS = 250
+
+    # ドラッグ中のセグメント移動をまとめて反映する間隔（ミリ秒）
+    SEGMENT_MOVE_FLUSH_MS = 40
+
+    # 字幕一覧の1行の高さ（px）。表示範囲の行だけを描画する
+    LIST_ROW_HEIGHT = 28
+
     def __init__(self, master, app: "App", **kwargs) -> None:
         self._subtitle_path: Optional[Path] = None
         self._video_path: Optional[Path] = None
+        self._video_loaded: bool = False
         self._video_title: str = ""
         self._output_dir: Optional[Path] = None
         self._subs: Optional[pysubs2.SSAFile] = None
         self._segments: List[TimelineSegment] = []
+        # 現在の字幕ラベル・字幕一覧用の表示テキスト（_segments と同じ並び）
+        self._display_texts: List[str] = []
+        # 動画プレイヤーと共有する字幕リスト（_segments と同じ並び）
+        self._subtitle_entries: List[SubtitleEntry] = []
+        # 再生位置 → 字幕の検索用（開始時刻順。_order は _segments のインデックス）
+        self._starts_ms: np.ndarray = np.empty(0, dtype=np.int64)
+        self._ends_ms: np.ndarray = np.empty(0, dtype=np.int64)
+        self._max_ends_ms: np.ndarray = np.empty(0, dtype=np.int64)
+        self._order: np.ndarray = np.empty(0, dtype=np.intp)
+        self._last_active_idx: int = -1
+        self._last_label_text: str = ""
+        self._last_time_text: str = ""
         self._selected_segment: Optional[TimelineSegment] = None
         self._has_changes: bool = False
+        self._saving: bool = False
+        # 最後に動画プレイヤーへ反映した字幕スタイル（フォントサイズ, 位置）
+        self._last_style: Optional[tuple] = None
+        self._subtitle_update_id: Optional[str] = None
+        # 字幕一覧ウィンドウ（閉じても破棄せず再利用する）
+        self._list_window: Optional[ctk.CTkToplevel] = None
+        self._list_canvas: Optional[ctk.CTkCanvas] = None
+        self._pending_subtitle_ids: set = set()
+        # ドラッグ中に移動したセグメント（id → セグメント）と、その反映予約
+        self._pending_moves: Dict[int, TimelineSegment] = {}
+        self._move_flush_id: Optional[str] = None
         super().__init__(master, app, **kwargs)
 
     def _setup_ui(self) -> None:
@@ -288,6 +419,7 @@ class EditorView(BaseView):
         self._subtitle_path = kwargs.get("subtitle_path")
         self._video_title = kwargs.get("video_title", "")
         self._output_dir = kwargs.get("output_dir")
+        self._video_loaded = False
 
         # 動画パスを探す
         if self._subtitle_path:
@@ -296,7 +428,8 @@ class EditorView(BaseView):
         if self._video_title:
             self._title_label.configure(text=f"編集: {self._video_title[:30]}...")
 
-        # 字幕を読み込み
+        # 前の字幕を破棄してから読み込み（読み込み完了までは編集・保存できない）
+        self._clear_subtitles()
         if self._subtitle_path:
             self._load_subtitles()
 
@@ -309,65 +442,137 @@ class EditorView(BaseView):
         if not self._subtitle_path:
             return
 
-        # 字幕ファイルと同じディレクトリで動画を探す
-        subtitle_dir = Path(self._subtitle_path).parent
-        video_extensions = [".mp4", ".webm", ".mkv", ".avi", ".mov"]
+        subtitle_path = Path(self._subtitle_path)
+        cached = _VIDEO_PATH_CACHE.get(subtitle_path)
+        if cached is not None and cached.exists():
+            self._video_path = cached
+            return
 
-        # 同じ名前の動画を探す
-        base_name = Path(self._subtitle_path).stem
-        for ext in video_extensions:
-            video_path = subtitle_dir / f"{base_name}{ext}"
-            if video_path.exists():
-                self._video_path = video_path
-                return
+        # 字幕ファイルと同じディレクトリで同じ名前の動画を探し、
+        # なければdownloadsディレクトリを探す
+        subtitle_dir = subtitle_path.parent
+        video_path = (
+            _scan_video_file(subtitle_dir, subtitle_path.stem)
+            or _scan_video_file(subtitle_dir / "downloads")
+        )
+        if video_path is not None:
+            _VIDEO_PATH_CACHE[subtitle_path] = video_path
+            self._video_path = video_path
+
+    def _clear_subtitles(self) -> None:
+        """表示中の字幕データを破棄し、編集・保存を無効化."""
+        # 前の字幕に対する反映予約は新しい字幕に適用しない
+        if self._move_flush_id is not None:
+            self.after_cancel(self._move_flush_id)
+            self._move_flush_id = None
+        if self._subtitle_update_id is not None:
+            self.after_cancel(self._subtitle_update_id)
+            self._subtitle_update_id = None
+        self._pending_moves.clear()
+        self._pending_subtitle_ids.clear()
+
+        self._subs = None
+        self._segments = []
+        self._display_texts = []
+        self._subtitle_entries = []
+        self._selected_segment = None
+        self._has_changes = False
+        self._rebuild_time_index()
+
+        self._timeline.set_segments(self._segments)
+        self._video_player.clear_forced_subtitle()
+        self._video_player.set_subtitles(self._subtitle_entries)
+        if self._list_window is not None:
+            self._list_window.withdraw()
 
-        # downloadsディレクトリを探す
-        downloads_dir = subtitle_dir / "downloads"
-        if downloads_dir.exists():
-            for ext in video_extensions:
-                for video_file in downloads_dir.glob(f"*{ext}"):
-                    self._video_path = video_file
-                    return
+        self._set_edit_panel_enabled(False)
+        self._save_btn.configure(state="disabled")
+        self._update_save_button()
 
     def _load_subtitles(self) -> None:
-        """字幕ファイルを読み込み."""
+        """字幕ファイルをバックグラウンドで読み込み."""
         if not self._subtitle_path or not Path(self._subtitle_path).exists():
             return
 
+        self._title_label.configure(text="字幕を読み込み中...")
+
+        thread = threading.Thread(
+            target=self._read_subtitles,
+            args=(Path(self._subtitle_path),),
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _read_subtitles(self, subtitle_path: Path) -> None:
+        """字幕ファイルを解析（バックグラウンド）."""
         try:
-            self._subs = pysubs2.load(str(self._subtitle_path))
-            self._segments = []
-
-            for i, event in enumerate(self._subs.events):
-                segment = TimelineSegment(
-                    id=i,
-                    start_ms=event.start,
-                    end_ms=event.end,
-                    text=event.text,
-                )
-                self._segments.append(segment)
-
-            # タイムラインに設定
-            if self._segments:
-                max_end = max(seg.end_ms for seg in self._segments)
-                self._timeline.set_duration(max_end + 5000)  # 5秒余裕
-            self._timeline.set_segments(self._segments)
+            subs = _load_subtitle_cache(subtitle_path)
+            if subs is None:
+                # 一度に読み込んでから解析する（BOM付きUTF-8にも対応。不正なバイト列は読み込みエラーにする）
+                text = subtitle_path.read_bytes().decode("utf-8-sig")
+                subs = pysubs2.SSAFile.from_string(text)
+                _write_subtitle_cache(subtitle_path, subs.to_string("json"))
+        except Exception as e:
+            message = f"字幕の読み込みに失敗しました: {e}"
+            self.after(0, lambda: self._on_subtitles_load_failed(subtitle_path, message))
+            return
 
-            # 動画プレイヤーに字幕を設定
-            subtitle_entries = [
-                SubtitleEntry(
-                    start_ms=seg.start_ms,
-                    end_ms=seg.end_ms,
-                    text=seg.text,
-                )
-                for seg in self._segments
-            ]
-            self._video_player.set_subtitles(subtitle_entries)
+        self.after(0, lambda: self._on_subtitles_loaded(subtitle_path, subs))
 
-            self._has_changes = False
+    def _on_subtitles_load_failed(self, subtitle_path: Path, message: str) -> None:
+        """字幕の読み込み失敗を表示."""
+        # 読み込み中に別の字幕が開かれていたら破棄
+        if not self._subtitle_path or Path(self._subtitle_path) != subtitle_path:
+            return
 
-        except Exception as e:
-            self._show_error(f"字幕の読み込みに失敗しました: {e}")
+        # 「読み込み中」の表示を戻す（エラー表示の後もこの表示に戻る）
+        self._title_label.configure(
+            text="字幕編集" if not self._video_title else f"編集: {self._video_title[:30]}...",
+        )
+        self._show_error(message)
+
+    def _on_subtitles_loaded(self, subtitle_path: Path, subs: pysubs2.SSAFile) -> None:
+        """読み込んだ字幕をビューに反映."""
+        # 読み込み中に別の字幕が開かれていたら破棄
+        if not self._subtitle_path or Path(self._subtitle_path) != subtitle_path:
+            return
+
+        self._title_label.configure(
+            text="字幕編集" if not self._video_title else f"編集: {self._video_title[:30]}...",
+        )
+
+        self._subs = subs
+        self._pending_subtitle_ids.clear()
+        self._pending_moves.clear()
+        self._segments = [
+            TimelineSegment(id=i, start_ms=event.start, end_ms=event.end, text=event.text)
+            for i, event in enumerate(subs.events)
+        ]
+        self._display_texts = [self._to_display_text(seg.text) for seg in self._segments]
+        self._rebuild_time_index()
+
+        # タイムラインに設定（動画が読み込めていれば長さは動画に合わせる）
+        if self._segments and not self._video_loaded:
+            max_end = int(self._ends_ms.max())
+            self._timeline.set_duration(max_end + 5000)  # 5秒余裕
+        self._timeline.set_segments(self._segments)
+
+        # 動画プレイヤーに字幕を設定
+        self._subtitle_entries = [
+            SubtitleEntry(
+                start_ms=seg.start_ms,
+                end_ms=seg.end_ms,
+                text=seg.text,
+            )
+            for seg in self._segments
+        ]
+        self._video_player.set_subtitles(self._subtitle_entries)
+
+        self._has_changes = False
+        self._update_save_button()
+        # 前の字幕の保存中なら、保存完了時に有効化される
+        if not self._saving:
+            self._save_btn.configure(state="normal")
 
     def _load_video(self) -> None:
         """動画を読み込み."""
@@ -375,6 +580,7 @@ class EditorView(BaseView):
             return
 
         success = self._video_player.load_video(self._video_path)
+        self._video_loaded = success
         if success:
             duration = self._video_player.get_duration_ms()
             self._timeline.set_duration(duration)
@@ -404,13 +610,39 @@ class EditorView(BaseView):
         self._timeline.set_position(position_ms)
         self._update_time_display()
 
-        # 現在の字幕を表示
-        for seg in self._segments:
-            if seg.start_ms <= position_ms <= seg.end_ms:
-                text = seg.text.replace("\\N", " ")[:50]
-                self._current_subtitle_label.configure(text=f"📝 {text}")
-                return
-        self._current_subtitle_label.configure(text="")
+        # 現在の字幕を表示（開始時刻が position_ms 以下で最後のセグメント）
+        starts = self._starts_ms
+        idx = self._last_active_idx
+        # 前回と同じセグメントの範囲内ならそのまま使い、外れたときだけ二分探索する
+        if not (
+            0 <= idx < len(starts)
+            and starts[idx] <= position_ms
+            and (idx + 1 == len(starts) or starts[idx + 1] > position_ms)
+        ):
+            idx = int(np.searchsorted(starts, position_ms, side="right")) - 1
+            self._last_active_idx = idx
+
+        active = self._find_active_segment(idx, position_ms)
+        if active >= 0:
+            label_text = f"📝 {self._display_texts[active]}"
+        else:
+            label_text = ""
+
+        if label_text != self._last_label_text:
+            self._last_label_text = label_text
+            self._current_subtitle_label.configure(text=label_text)
+
+    def _find_active_segment(self, idx: int, position_ms: int) -> int:
+        """表示中のセグメント番号を返す（重なっている場合は元の並びで先のもの、なければ-1）.
+
+        idx は開始時刻が position_ms 以下で最後のセグメントの、開始時刻順での位置。
+        """
+        if idx < 0 or self._max_ends_ms[idx] < position_ms:
+            return -1
+        # 終了時刻の累積最大が position_ms 未満の範囲は、すべて表示が終わっている
+        lo = int(np.searchsorted(self._max_ends_ms[:idx + 1], position_ms, side="left"))
+        candidates = self._order[lo:idx + 1][self._ends_ms[lo:idx + 1] >= position_ms]
+        return int(candidates.min()) if len(candidates) else -1
 
     def _on_timeline_seek(self, position_ms: int) -> None:
         """タイムラインシーク時."""
@@ -450,24 +682,47 @@ class EditorView(BaseView):
 
     def _on_segment_moved(self, segment: TimelineSegment, new_start: int, new_end: int) -> None:
         """セグメント移動時."""
-        # pysubs2のイベントを更新
-        if self._subs and segment.id < len(self._subs.events):
-            self._subs.events[segment.id].start = new_start
-            self._subs.events[segment.id].end = new_end
+        # タイムラインはコールバック後にセグメントを更新するため、ここで先に反映する
+        segment.start_ms = new_start
+        segment.end_ms = new_end
+
+        # ドラッグ中は連続して呼ばれるので、字幕・編集パネルへの反映は一定間隔でまとめて行う
+        self._pending_moves[segment.id] = segment
+        if self._move_flush_id is None:
+            self._move_flush_id = self.after(
+                self.SEGMENT_MOVE_FLUSH_MS,
+                self._flush_segment_moves,
+            )
+
+    def _flush_segment_moves(self) -> None:
+        """移動されたセグメントの時刻を字幕データ・動画プレイヤー・編集パネルに反映."""
+        self._move_flush_id = None
+        if not self._pending_moves:
+            return
+        moved, self._pending_moves = self._pending_moves, {}
+
+        self._rebuild_time_index()
+
+        for segment in moved.values():
+            # pysubs2のイベントを更新
+            if self._subs and segment.id < len(self._subs.events):
+                self._subs.events[segment.id].start = segment.start_ms
+                self._subs.events[segment.id].end = segment.end_ms
+
+            # 動画プレイヤーの字幕も更新
+            self._sync_video_subtitle(segment)
 
         self._has_changes = True
         self._update_save_button()
 
-        # 動画プレイヤーの字幕も更新
-        self._update_video_subtitles()
-
         # 編集パネルを更新（選択中の場合）
-        if self._selected_segment == segment:
+        segment = self._selected_segment
+        if segment is not None and segment.id in moved:
             self._start_entry.delete(0, "end")
-            self._start_entry.insert(0, self._format_time_ms(new_start))
+            self._start_entry.insert(0, self._format_time_ms(segment.start_ms))
             self._end_entry.delete(0, "end")
-            self._end_entry.insert(0, self._format_time_ms(new_end))
-            duration_ms = new_end - new_start
+            self._end_entry.insert(0, self._format_time_ms(segment.end_ms))
+            duration_ms = segment.end_ms - segment.start_ms
             self._duration_label.configure(text=f"長さ: {duration_ms / 1000:.1f}秒")
 
     def _on_timing_changed(self, event=None) -> None:
@@ -482,8 +737,16 @@ class EditorView(BaseView):
             if start_ms >= end_ms:
                 return
 
+            # 値が変わっていなければ（入力欄からフォーカスが外れただけなら）何もしない
+            if (
+                start_ms == self._selected_segment.start_ms
+                and end_ms == self._selected_segment.end_ms
+            ):
+                return
+
             self._selected_segment.start_ms = start_ms
             self._selected_segment.end_ms = end_ms
+            self._rebuild_time_index()
 
             # pysubs2のイベントを更新
             if self._subs and self._selected_segment.id < len(self._subs.events):
@@ -493,7 +756,7 @@ class EditorView(BaseView):
             self._has_changes = True
             self._update_save_button()
             self._timeline.set_segments(self._segments)
-            self._update_video_subtitles()
+            self._schedule_video_subtitle_update(self._selected_segment)
 
             duration_ms = end_ms - start_ms
             self._duration_label.configure(text=f"長さ: {duration_ms / 1000:.1f}秒")
@@ -508,6 +771,7 @@ class EditorView(BaseView):
 
         new_text = self._text_entry.get("1.0", "end-1c")
         self._selected_segment.text = new_text
+        self._display_texts[self._selected_segment.id] = self._to_display_text(new_text)
 
         # pysubs2のイベントを更新
         if self._subs and self._selected_segment.id < len(self._subs.events):
@@ -515,13 +779,18 @@ class EditorView(BaseView):
 
         self._has_changes = True
         self._update_save_button()
-        self._update_video_subtitles()
+        self._schedule_video_subtitle_update(self._selected_segment)
 
     def _on_style_changed(self, value=None) -> None:
         """スタイル変更時."""
         font_size = int(self._font_size_var.get())
         position = self._position_var.get()
 
+        style = (font_size, position)
+        if style == self._last_style:
+            return
+        self._last_style = style
+
         self._video_player.set_subtitle_style(
             font_size=font_size,
             position=position,
@@ -533,25 +802,63 @@ class EditorView(BaseView):
         current_pos = self._video_player.get_position_ms()
         self._video_player.seek(current_pos)
 
+    def _rebuild_time_index(self) -> None:
+        """セグメントの開始/終了時刻から、開始時刻順の検索用配列を作り直す."""
+        count = len(self._segments)
+        starts = np.fromiter((seg.start_ms for seg in self._segments), dtype=np.int64, count=count)
+        ends = np.fromiter((seg.end_ms for seg in self._segments), dtype=np.int64, count=count)
+        self._order = np.argsort(starts, kind="stable")
+        self._starts_ms = starts[self._order]
+        self._ends_ms = ends[self._order]
+        # 開始時刻順に見た終了時刻の累積最大（重なったセグメントの探索用）
+        self._max_ends_ms = np.maximum.accumulate(self._ends_ms)
+        self._last_active_idx = -1
+
+    def _schedule_video_subtitle_update(self, segment: TimelineSegment) -> None:
+        """セグメントの字幕反映を予約（連続した編集は最後の1回にまとめる）."""
+        self._pending_subtitle_ids.add(segment.id)
+        if self._subtitle_update_id is not None:
+            self.after_cancel(self._subtitle_update_id)
+        self._subtitle_update_id = self.after(
+            self.SUBTITLE_UPDATE_DELAY_MS,
+            self._flush_video_subtitle_updates,
+        )
+
+    def _flush_video_subtitle_updates(self) -> None:
+        """予約されたセグメントの字幕を動画プレイヤーに反映."""
+        self._subtitle_update_id = None
+        pending, self._pending_subtitle_ids = self._pending_subtitle_ids, set()
+        for segment_id in pending:
+            self._sync_video_subtitle(self._segments[segment_id])
+
+    def _sync_video_subtitle(self, segment: TimelineSegment) -> None:
+        """1セグメント分だけ動画プレイヤーの字幕を更新.
+
+        _subtitle_entries はプレイヤーと共有しているため、エントリはその場で書き換えられる。
+        """
+        self._video_player.update_subtitle(
+            segment.id,
+            segment.start_ms,
+            segment.end_ms,
+            segment.text,
+        )
+
     def _update_video_subtitles(self) -> None:
-        """動画プレイヤーの字幕を更新."""
-        subtitle_entries = [
-            SubtitleEntry(
-                start_ms=seg.start_ms,
-                end_ms=seg.end_ms,
-                text=seg.text,
-            )
-            for seg in self._segments
-        ]
-        self._video_player.set_subtitles(subtitle_entries)
+        """動画プレイヤーの字幕を更新（予約中の反映もここで行う）."""
+        if self._subtitle_update_id is not None:
+            self.after_cancel(self._subtitle_update_id)
+            self._flush_video_subtitle_updates()
+        self._video_player.set_subtitles(self._subtitle_entries)
 
     def _update_time_display(self) -> None:
         """時間表示を更新."""
         current = self._video_player.get_position_ms()
         total = self._video_player.get_duration_ms()
-        self._time_label.configure(
-            text=f"{self._format_time_short(current)} / {self._format_time_short(total)}"
-        )
+        time_text = f"{self._format_time_short(current)} / {self._format_time_short(total)}"
+        # 表示は秒単位なので、同じ秒のうちは再設定しない
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self._time_label.configure(text=time_text)
 
     def _update_save_button(self) -> None:
         """保存ボタンの状態を更新."""
@@ -560,6 +867,10 @@ class EditorView(BaseView):
         else:
             self._save_btn.configure(text="保存")
 
+    def _to_display_text(self, text: str) -> str:
+        """ラベル表示用に改行を空白にして先頭50文字に切り詰める."""
+        return text.replace("\\N", " ")[:50]
+
     def _format_time_ms(self, ms: int) -> str:
         """ミリ秒を MM:SS.mmm 形式にフォーマット."""
         seconds = ms / 1000
@@ -569,39 +880,96 @@ class EditorView(BaseView):
 
     def _format_time_short(self, ms: int) -> str:
         """ミリ秒を MM:SS 形式にフォーマット."""
-        seconds = ms // 1000
-        minutes = seconds // 60
-        secs = seconds % 60
+        minutes, secs = divmod(ms // 1000, 60)
         return f"{minutes:02d}:{secs:02d}"
 
     def _parse_time_ms(self, time_str: str) -> int:
-        """時間文字列をミリ秒に変換."""
-        parts = time_str.split(":")
-        if len(parts) == 2:
-            minutes = int(parts[0])
-            seconds = float(parts[1])
-            return int((minutes * 60 + seconds) * 1000)
-        raise ValueError(f"Invalid time format: {time_str}")
+        """時間文字列（M:SS または M:SS.mmm）をミリ秒に変換."""
+        time_str = time_str.strip()
+        colon = time_str.find(":")
+        if colon < 0 or time_str.find(":", colon + 1) >= 0:
+            raise ValueError(f"Invalid time format: {time_str}")
+
+        dot = time_str.find(".", colon + 1)
+        if dot < 0:
+            seconds, fraction = time_str[colon + 1:], ""
+        else:
+            seconds, fraction = time_str[colon + 1:dot], time_str[dot + 1:]
+
+        # 小数部はミリ秒の桁までを使う（それ以下は切り捨て）
+        ms = int(fraction[:3].ljust(3, "0")) if fraction else 0
+        return (int(time_str[:colon]) * 60 + int(seconds)) * 1000 + ms
 
     def _on_save_clicked(self) -> None:
         """保存ボタンクリック時."""
-        if not self._subs or not self._subtitle_path:
+        if not self._subs or not self._subtitle_path or self._saving:
             return
 
+        # ドラッグ中の移動が未反映なら先に反映する
+        if self._move_flush_id is not None:
+            self.after_cancel(self._move_flush_id)
+            self._flush_segment_moves()
+
+        subtitle_path = Path(self._subtitle_path)
+        srt_path = subtitle_path.with_suffix(".srt")
+
         try:
-            # 保存
-            self._subs.save(str(self._subtitle_path))
+            # 保存中も編集できるよう、内容はメインスレッドで文字列化しておく
+            subs_format = pysubs2.formats.get_format_identifier(subtitle_path.suffix)
+            texts = {
+                subtitle_path: self._subs.to_string(subs_format),
+                srt_path: self._subs.to_string("srt"),
+            }
+            subs_json = self._subs.to_string("json")
+        except Exception as e:
+            self._show_error(f"保存に失敗しました: {e}")
+            return
 
-            # SRT形式も更新
-            srt_path = Path(self._subtitle_path).with_suffix(".srt")
-            self._subs.save(str(srt_path))
+        # 保存中の編集は未保存として扱う
+        self._has_changes = False
+        self._saving = True
+        self._save_btn.configure(state="disabled")
 
-            self._has_changes = False
+        thread = threading.Thread(
+            target=self._write_subtitles,
+            args=(subtitle_path, texts, subs_json),
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _write_subtitles(
+        self,
+        subtitle_path: Path,
+        texts: Dict[Path, str],
+        subs_json: str,
+    ) -> None:
+        """字幕ファイルを書き出す（バックグラウンド）."""
+        try:
+            for path, text in texts.items():
+                _write_text_atomic(path, text)
+        except Exception as e:
+            message = f"保存に失敗しました: {e}"
+            self.after(0, lambda: self._on_save_finished(message))
+            return
+
+        # 保存した内容でキャッシュを更新
+        _write_subtitle_cache(subtitle_path, subs_json)
+
+        self.after(0, lambda: self._on_save_finished(None))
+
+    def _on_save_finished(self, error: Optional[str]) -> None:
+        """保存完了時."""
+        self._saving = False
+        self._save_btn.configure(state="normal")
+
+        if error:
+            self._has_changes = True
             self._update_save_button()
-            self._show_success("保存しました")
+            self._show_error(error)
+            return
 
-        except Exception as e:
-            self._show_error(f"保存に失敗しました: {e}")
+        self._update_save_button()
+        self._show_success("保存しました")
 
     def _on_back_clicked(self) -> None:
         """戻るボタンクリック時."""
@@ -614,38 +982,111 @@ class EditorView(BaseView):
         if not self._segments:
             return
 
-        list_window = ctk.CTkToplevel(self)
-        list_window.title("字幕一覧")
-        list_window.geometry("600x400")
-        list_window.transient(self.winfo_toplevel())
-
-        # スクロール可能なリスト
-        scrollable = ctk.CTkScrollableFrame(list_window)
-        scrollable.pack(fill="both", expand=True, padx=10, pady=10)
-
-        for seg in self._segments:
-            frame = ctk.CTkFrame(scrollable, fg_color=COLORS.BG_SECONDARY)
-            frame.pack(fill="x", pady=2)
+        if self._list_window is None or not self._list_window.winfo_exists():
+            list_window = ctk.CTkToplevel(self)
+            list_window.title("字幕一覧")
+            list_window.geometry("600x400")
+            list_window.transient(self.winfo_toplevel())
+            # 閉じるときは破棄せず隠す
+            list_window.protocol("WM_DELETE_WINDOW", list_window.withdraw)
+
+            # 行はウィジェットを作らず、見えている範囲だけキャンバスに描画する
+            self._list_canvas = ctk.CTkCanvas(
+                list_window,
+                bg=COLORS.BG_MAIN,
+                highlightthickness=0,
+                yscrollincrement=self.LIST_ROW_HEIGHT,
+            )
+            scrollbar = ctk.CTkScrollbar(list_window, command=self._on_list_scroll)
+            self._list_canvas.configure(yscrollcommand=scrollbar.set)
+            scrollbar.pack(side="right", fill="y", pady=10)
+            self._list_canvas.pack(fill="both", expand=True, padx=10, pady=10)
+
+            self._list_canvas.bind("<Configure>", lambda e: self._draw_subtitle_list())
+            self._list_canvas.bind("<Button-1>", self._on_list_click)
+            self._list_canvas.bind("<MouseWheel>", self._on_list_wheel)
+            self._list_canvas.bind("<Button-4>", lambda e: self._on_list_scroll("scroll", -3, "units"))
+            self._list_canvas.bind("<Button-5>", lambda e: self._on_list_scroll("scroll", 3, "units"))
+
+            self._list_window = list_window
+        else:
+            self._list_window.deiconify()
+            self._list_window.lift()
+
+        self._draw_subtitle_list()
+
+    def _draw_subtitle_list(self) -> None:
+        """字幕一覧のうち、表示範囲にある行だけを描画."""
+        canvas = self._list_canvas
+        row_height = self.LIST_ROW_HEIGHT
+        width = canvas.winfo_width()
+        canvas.configure(scrollregion=(0, 0, width, len(self._segments) * row_height))
+        canvas.delete("row")
+
+        top = int(canvas.canvasy(0))
+        first = max(0, top // row_height)
+        last = min(len(self._segments), (top + canvas.winfo_height()) // row_height + 1)
+
+        for i in range(first, last):
+            seg = self._segments[i]
+            y = i * row_height
+            center_y = y + row_height // 2
+
+            canvas.create_rectangle(
+                0, y + 1,
+                width, y + row_height - 1,
+                fill=COLORS.BG_SECONDARY,
+                outline="",
+                tags=("row",),
+            )
 
             time_str = f"{self._format_time_short(seg.start_ms)} - {self._format_time_short(seg.end_ms)}"
-            NaniLabel(frame, text=time_str, variant="caption").pack(side="left", padx=5)
+            canvas.create_text(
+                8, center_y,
+                text=time_str,
+                fill=COLORS.TEXT_MUTED,
+                font=NaniTheme.get_font("xs"),
+                anchor="w",
+                tags=("row",),
+            )
 
-            text = seg.text.replace("\\N", " ")[:40]
-            NaniLabel(frame, text=text, variant="default").pack(side="left", padx=5, fill="x", expand=True)
+            canvas.create_text(
+                110, center_y,
+                text=self._display_texts[seg.id][:40],
+                fill=COLORS.TEXT_PRIMARY,
+                font=NaniTheme.get_font("base"),
+                anchor="w",
+                tags=("row",),
+            )
 
-            # ジャンプボタン
-            jump_btn = NaniButton(
-                frame,
+            # ジャンプ（行のどこをクリックしても移動する）
+            canvas.create_text(
+                width - 12, center_y,
                 text="→",
-                variant="ghost",
-                width=30,
-                command=lambda s=seg: self._jump_to_segment(s, list_window),
+                fill=COLORS.PRIMARY,
+                font=NaniTheme.get_font("base"),
+                tags=("row",),
             )
-            jump_btn.pack(side="right", padx=5)
 
-    def _jump_to_segment(self, segment: TimelineSegment, window: ctk.CTkToplevel) -> None:
+    def _on_list_scroll(self, *args) -> None:
+        """字幕一覧のスクロール."""
+        self._list_canvas.yview(*args)
+        self._draw_subtitle_list()
+
+    def _on_list_wheel(self, event) -> None:
+        """字幕一覧のマウスホイール."""
+        self._on_list_scroll("scroll", -3 if event.delta > 0 else 3, "units")
+
+    def _on_list_click(self, event) -> None:
+        """字幕一覧の行クリック."""
+        index = int(self._list_canvas.canvasy(event.y)) // self.LIST_ROW_HEIGHT
+        if 0 <= index < len(self._segments):
+            self._jump_to_segment(self._segments[index])
+
+    def _jump_to_segment(self, segment: TimelineSegment) -> None:
         """指定セグメントにジャンプ."""
-        window.destroy()
+        if self._list_window is not None:
+            self._list_window.withdraw()
         self._timeline.select_segment(segment.id)
         self._on_segment_selected(segment)
 
@@ -667,6 +1108,12 @@ class EditorView(BaseView):
 
     def destroy(self) -> None:
         """クリーンアップ."""
+        if self._subtitle_update_id is not None:
+            self.after_cancel(self._subtitle_update_id)
+            self._subtitle_update_id = None
+        if self._move_flush_id is not None:
+            self.after_cancel(self._move_flush_id)
+            self._move_flush_id = None
         if hasattr(self, '_video_player'):
             self._video_player.destroy()
         super().destroy()
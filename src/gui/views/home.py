@@ -5,7 +5,8 @@
 URL入力と処理開始を行うメイン画面。
 """
 
-import re
+from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 import customtkinter as ctk
@@ -23,16 +24,65 @@ from .base import BaseView
 if TYPE_CHECKING:
     from ..app import App
 
+try:
+    # google-re2 があれば使用（線形時間で照合し、バックトラックしない）
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# YouTube URLの正規表現パターン（モジュール読み込み時に一度だけコンパイル）
+_YOUTUBE_URL_RE = _re.compile(
+    r"^(https?://)?(www\.)?"
+    r"(youtube\.com/(watch\?v=|shorts/)|youtu\.be/)"
+    r"[\w-]+"
+)
+
+
+def _ellipsize(text: str, max_length: int) -> str:
+    """max_length 文字を超える文字列を切り詰めて "..." を付ける."""
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
+
+@lru_cache(maxsize=256)
+def _format_created_at(created_at: str) -> str:
+    """ISO形式の作成日時を表示用（YYYY/MM/DD HH:MM）に変換（解析できなければ空文字）."""
+    try:
+        return datetime.fromisoformat(created_at).strftime("%Y/%m/%d %H:%M")
+    except Exception:
+        return ""
+
+
+# これより長い入力はURLとして扱わない
+_MAX_URL_LENGTH = 2048
+
+# 有効なURLでは "youtu" は先頭の "https://www." の直後までに現れるので、この範囲だけを探す
+_YOUTU_SEARCH_END = 32
+
 
 class HomeView(BaseView):
     """ホームビュー."""
 
     # YouTube URLの正規表現パターン
-    YOUTUBE_URL_PATTERN = re.compile(
-        r"^(https?://)?(www\.)?"
-        r"(youtube\.com/(watch\?v=|shorts/)|youtu\.be/)"
-        r"[\w-]+"
-    )
+    YOUTUBE_URL_PATTERN = _YOUTUBE_URL_RE
+
+    # 翻訳先言語の選択肢（表示名 → 言語コード）
+    _LANGUAGE_OPTIONS = {
+        "ja (日本語)": "ja",
+        "en (English)": "en",
+        "zh (中文)": "zh",
+        "ko (한국어)": "ko",
+        "es (Español)": "es",
+    }
+
+    # 入力が止まってからURLを検証するまでの待ち時間（ミリ秒）
+    URL_VALIDATE_DELAY_MS = 150
+
+    def __init__(self, master, app: "App", **kwargs) -> None:
+        self._validate_after_id: Optional[str] = None
+        self._last_validated_url: str = ""
+        # 最後に表示した履歴（変わっていなければ再構築しない）
+        self._last_history: Optional[tuple] = None
+        super().__init__(master, app, **kwargs)
 
     def _setup_ui(self) -> None:
         """UIを構築."""
@@ -111,7 +161,7 @@ class HomeView(BaseView):
         self._language_var = ctk.StringVar(value="ja")
         language_menu = ctk.CTkOptionMenu(
             lang_frame,
-            values=["ja (日本語)", "en (English)", "zh (中文)", "ko (한국어)", "es (Español)"],
+            values=list(self._LANGUAGE_OPTIONS),
             variable=self._language_var,
             width=150,
             fg_color=COLORS.BG_SECONDARY,
@@ -157,9 +207,21 @@ class HomeView(BaseView):
         settings_button.pack()
 
     def _on_url_change(self, event=None) -> None:
-        """URL入力変更時."""
+        """URL入力変更時（連続した入力は最後の1回だけ検証する）."""
+        if self._validate_after_id is not None:
+            self.after_cancel(self._validate_after_id)
+        self._validate_after_id = self.after(self.URL_VALIDATE_DELAY_MS, self._validate_url)
+
+    def _validate_url(self) -> None:
+        """URLを検証して、エラー表示と開始ボタンを更新."""
+        self._validate_after_id = None
         url = self._url_entry.get().strip()
 
+        # 前回検証したURLから変わっていなければ何もしない
+        if url == self._last_validated_url:
+            return
+        self._last_validated_url = url
+
         if not url:
             self._error_label.configure(text="")
             self._start_button.configure(state="disabled")
@@ -172,15 +234,21 @@ class HomeView(BaseView):
             self._error_label.configure(text="有効なYouTube URLを入力してください")
             self._start_button.configure(state="disabled")
 
-    def _is_valid_youtube_url(self, url: str) -> bool:
-        """YouTube URLが有効かどうかをチェック."""
-        return bool(self.YOUTUBE_URL_PATTERN.match(url))
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _is_valid_youtube_url(url: str) -> bool:
+        """YouTube URLが有効かどうかをチェック（同じ入力の結果はキャッシュ）."""
+        # 明らかに違う入力は正規表現を使わずに弾く
+        if not url or len(url) > _MAX_URL_LENGTH:
+            return False
+        if "youtu" not in url[:_YOUTU_SEARCH_END]:
+            return False
+        return _YOUTUBE_URL_RE.match(url) is not None
 
     def _get_target_language(self) -> str:
         """選択された言語コードを取得."""
-        value = self._language_var.get()
         # "ja (日本語)" -> "ja"
-        return value.split(" ")[0]
+        return self._LANGUAGE_OPTIONS.get(self._language_var.get(), "ja")
 
     def _on_start_clicked(self) -> None:
         """処理開始ボタンクリック時."""
@@ -204,6 +272,10 @@ class HomeView(BaseView):
     def on_show(self, **kwargs) -> None:
         """ビュー表示時."""
         # URLフィールドをクリア
+        if self._validate_after_id is not None:
+            self.after_cancel(self._validate_after_id)
+            self._validate_after_id = None
+        self._last_validated_url = ""
         self._url_entry.delete(0, "end")
         self._error_label.configure(text="")
         self._start_button.configure(state="disabled")
@@ -213,15 +285,21 @@ class HomeView(BaseView):
 
     def _refresh_history(self) -> None:
         """履歴を更新."""
-        # 既存の履歴ウィジェットをクリア
-        for widget in self._history_frame.winfo_children():
-            widget.destroy()
-
         # 履歴を取得
         from src.core.project_history import ProjectHistory
         history = ProjectHistory()
         recent_projects = history.get_recent(5)
 
+        # 前回表示した内容と同じなら、ウィジェットを作り直さない
+        current = tuple(recent_projects)
+        if current == self._last_history:
+            return
+        self._last_history = current
+
+        # 既存の履歴ウィジェットをクリア
+        for widget in self._history_frame.winfo_children():
+            widget.destroy()
+
         if not recent_projects:
             return
 
@@ -253,10 +331,9 @@ class HomeView(BaseView):
         content.grid_columnconfigure(1, weight=1)
 
         # タイトル（クリック可能）
-        title_text = project.video_title[:40] + "..." if len(project.video_title) > 40 else project.video_title
         title_btn = ctk.CTkButton(
             content,
-            text=title_text,
+            text=_ellipsize(project.video_title, 40),
             font=NaniTheme.get_font("base"),
             fg_color="transparent",
             hover_color=COLORS.BG_HOVER,
@@ -267,16 +344,9 @@ class HomeView(BaseView):
         title_btn.grid(row=0, column=0, columnspan=2, sticky="w")
 
         # 日時
-        from datetime import datetime
-        try:
-            created = datetime.fromisoformat(project.created_at)
-            date_str = created.strftime("%Y/%m/%d %H:%M")
-        except Exception:
-            date_str = ""
-
         date_label = NaniLabel(
             content,
-            text=date_str,
+            text=_format_created_at(project.created_at),
             variant="caption",
         )
         date_label.grid(row=1, column=0, sticky="w")
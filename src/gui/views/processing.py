@@ -8,8 +8,9 @@
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Callable
+from typing import TYPE_CHECKING, Dict, Optional, Callable, Set, Tuple
 
 import customtkinter as ctk
 
@@ -26,6 +27,11 @@ if TYPE_CHECKING:
     from ..app import App
 
 
+def _ellipsize(text: str, max_length: int) -> str:
+    """max_length 文字を超える文字列を切り詰めて "..." を付ける."""
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
+
 class ProcessingStep(Enum):
     """処理ステップ."""
     DOWNLOAD = "download"
@@ -48,12 +54,32 @@ class StepStatus:
 class ProcessingView(BaseView):
     """処理中ビュー."""
 
+    # 進捗コールバックをまとめてUIに反映する間隔（ミリ秒、約30fps）
+    PROGRESS_FLUSH_MS = 33
+
+    # ステータスごとのアイコンと色
+    _STATUS_ICONS = {
+        "pending": ("○", COLORS.TEXT_MUTED),
+        "running": ("●", COLORS.PRIMARY),
+        "completed": ("✓", COLORS.SUCCESS),
+        "error": ("✗", COLORS.DANGER),
+    }
+
     def __init__(self, master, app: "App", **kwargs) -> None:
         self._url: str = ""
         self._target_language: str = "ja"
         self._is_processing: bool = False
         self._cancel_requested: bool = False
+        # キャンセルボタンで set される（イベントループ上で待機中の処理を中断する）
+        self._cancel_event = asyncio.Event()
         self._step_widgets: dict = {}
+        # ステップごとの未反映の最新進捗 (progress, message) と、反映を予約済みのステップ
+        self._pending_progress: Dict[ProcessingStep, Tuple[float, str]] = {}
+        self._flush_scheduled: Set[ProcessingStep] = set()
+        # 全体進捗の計算用（完了したステップ数と、実行中のステップ）
+        self._completed_count: int = 0
+        self._running_step: Optional[StepStatus] = None
+        self._last_overall_percent: int = 0
         super().__init__(master, app, **kwargs)
 
     def _setup_ui(self) -> None:
@@ -113,6 +139,8 @@ class ProcessingView(BaseView):
             StepStatus(ProcessingStep.TRANSLATE, "翻訳"),
             StepStatus(ProcessingStep.GENERATE_SUBTITLE, "字幕生成"),
         ]
+        # 進捗コールバックから毎回リストを走査しないよう、ステップ種別で引けるようにする
+        self._steps_by_type = {step.step: step for step in self._steps}
 
         for step in self._steps:
             step_frame = ctk.CTkFrame(steps_frame, fg_color="transparent")
@@ -146,6 +174,9 @@ class ProcessingView(BaseView):
                 "status": status_label,
                 "name": name_label,
                 "message": message_label,
+                # 最後に設定した値（同じ値での再設定を省く）
+                "last_icon": None,
+                "last_message": None,
             }
 
         # 現在の処理メッセージ
@@ -185,12 +216,15 @@ class ProcessingView(BaseView):
 
         # UIをリセット
         self._title_label.configure(text="処理中...")
-        self._video_info_label.configure(text=url[:50] + "..." if len(url) > 50 else url)
+        self._video_info_label.configure(text=_ellipsize(url, 50))
         self._overall_progress.set(0)
         self._overall_label.configure(text="0%")
+        self._last_overall_percent = 0
         self._current_message.configure(text="処理を開始しています...")
 
         # ステップをリセット
+        self._completed_count = 0
+        self._running_step = None
         for step in self._steps:
             step.status = "pending"
             step.progress = 0.0
@@ -210,26 +244,27 @@ class ProcessingView(BaseView):
         if not widgets:
             return
 
-        status_icons = {
-            "pending": ("○", COLORS.TEXT_MUTED),
-            "running": ("●", COLORS.PRIMARY),
-            "completed": ("✓", COLORS.SUCCESS),
-            "error": ("✗", COLORS.DANGER),
-        }
-
-        icon, color = status_icons.get(step.status, ("○", COLORS.TEXT_MUTED))
-        widgets["status"].configure(text=icon, text_color=color)
-        widgets["message"].configure(text=step.message)
+        icon = self._STATUS_ICONS.get(step.status, self._STATUS_ICONS["pending"])
+        if icon != widgets["last_icon"]:
+            widgets["last_icon"] = icon
+            widgets["status"].configure(text=icon[0], text_color=icon[1])
+        if step.message != widgets["last_message"]:
+            widgets["last_message"] = step.message
+            widgets["message"].configure(text=step.message)
 
     def _update_overall_progress(self) -> None:
         """全体の進捗を更新."""
-        total_steps = len(self._steps)
-        completed = sum(1 for s in self._steps if s.status == "completed")
-        running_progress = sum(s.progress for s in self._steps if s.status == "running")
+        running = self._running_step
+        running_progress = running.progress if running is not None else 0.0
 
-        overall = (completed + running_progress / 100) / total_steps
+        overall = (self._completed_count + running_progress / 100) / len(self._steps)
         self._overall_progress.set(overall)
-        self._overall_label.configure(text=f"{int(overall * 100)}%")
+
+        # ラベルは整数%表示なので、値が変わったときだけ更新する
+        percent = int(overall * 100)
+        if percent != self._last_overall_percent:
+            self._last_overall_percent = percent
+            self._overall_label.configure(text=f"{percent}%")
 
     def _start_processing(self) -> None:
         """処理を開始."""
@@ -243,9 +278,9 @@ class ProcessingView(BaseView):
             self._is_processing = False
             try:
                 result = f.result()
-                self.after(0, lambda: self._on_processing_complete(result))
+                self.after(0, partial(self._on_processing_complete, result))
             except Exception as e:
-                self.after(0, lambda: self._on_processing_error(str(e)))
+                self.after(0, partial(self._on_processing_error, str(e)))
 
         future.add_done_callback(on_done)
 
@@ -255,7 +290,6 @@ class ProcessingView(BaseView):
             AudioProcessor,
             OllamaClient,
             SubtitleGenerator,
-            Transcriber,
             Translator,
             VideoFetcher,
         )
@@ -264,6 +298,11 @@ class ProcessingView(BaseView):
         output_dir = Path("./output")
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        self._cancel_event.clear()
+        if self._cancel_requested:
+            # イベントをクリアする前にキャンセルされていた場合
+            self._cancel_event.set()
+
         result = {
             "success": False,
             "video_path": None,
@@ -271,20 +310,27 @@ class ProcessingView(BaseView):
             "error": None,
         }
 
+        transcriber = None
+
         try:
             # 1. 動画ダウンロード
             self._set_step_running(ProcessingStep.DOWNLOAD)
             fetcher = VideoFetcher(download_dir=output_dir / "downloads")
 
             def download_progress(progress: float, message: str):
-                self.after(0, lambda: self._update_step_progress(
-                    ProcessingStep.DOWNLOAD, progress, message
-                ))
+                self._post_step_progress(ProcessingStep.DOWNLOAD, progress, message)
 
-            download_result = await fetcher.download(
-                self._url,
-                progress_callback=download_progress,
-            )
+            try:
+                download_result = await self._await_cancellable(fetcher.download(
+                    self._url,
+                    progress_callback=download_progress,
+                ))
+            except BaseException:
+                # スレッドで続いているyt-dlpのダウンロードも進捗フックで中断させる
+                fetcher.cancel()
+                raise
+            finally:
+                fetcher.close()
 
             if self._cancel_requested:
                 raise Exception("処理がキャンセルされました")
@@ -297,23 +343,28 @@ class ProcessingView(BaseView):
             result["video_path"] = video_path
 
             self._set_step_completed(ProcessingStep.DOWNLOAD)
-            self.after(0, lambda: self._video_info_label.configure(
-                text=metadata.title[:50] + "..." if len(metadata.title) > 50 else metadata.title
+            self.after(0, partial(
+                self._video_info_label.configure,
+                text=_ellipsize(metadata.title, 50),
             ))
 
             # 2. 音声抽出
             self._set_step_running(ProcessingStep.EXTRACT_AUDIO)
             audio_processor = AudioProcessor(temp_dir=output_dir / "temp")
+            # 文字起こしモデルは処理間で使い回す（アプリが一定時間後に解放する）
+            transcriber = self.app.get_transcriber()
 
             def audio_progress(progress: float, message: str):
-                self.after(0, lambda: self._update_step_progress(
-                    ProcessingStep.EXTRACT_AUDIO, progress, message
-                ))
-
-            audio_path = await audio_processor.extract_audio(
-                video_path,
-                progress_callback=audio_progress,
-            )
+                self._post_step_progress(ProcessingStep.EXTRACT_AUDIO, progress, message)
+
+            # 文字起こしモデルの読み込みを音声抽出と並行して行う
+            audio_path, _ = await self._await_cancellable(asyncio.gather(
+                audio_processor.extract_audio(
+                    video_path,
+                    progress_callback=audio_progress,
+                ),
+                transcriber.preload(),
+            ))
 
             if self._cancel_requested:
                 raise Exception("処理がキャンセルされました")
@@ -322,20 +373,15 @@ class ProcessingView(BaseView):
 
             # 3. 文字起こし
             self._set_step_running(ProcessingStep.TRANSCRIBE)
-            transcriber = Transcriber()
 
             def transcribe_progress(progress: float, message: str):
-                self.after(0, lambda: self._update_step_progress(
-                    ProcessingStep.TRANSCRIBE, progress, message
-                ))
+                self._post_step_progress(ProcessingStep.TRANSCRIBE, progress, message)
 
-            try:
-                transcription = await transcriber.transcribe(
-                    audio_path,
-                    progress_callback=transcribe_progress,
-                )
-            finally:
-                transcriber.unload_model()
+            # キャンセル時の中断と、前回の文字起こしとの排他はアプリ側で行う
+            transcription = await self._await_cancellable(self.app.transcribe(
+                audio_path,
+                progress_callback=transcribe_progress,
+            ))
 
             if self._cancel_requested:
                 raise Exception("処理がキャンセルされました")
@@ -346,9 +392,10 @@ class ProcessingView(BaseView):
             self._set_step_running(ProcessingStep.TRANSLATE)
             ollama_client = OllamaClient()
 
-            if not await ollama_client.is_available():
-                self.after(0, lambda: self._current_message.configure(
-                    text="警告: Ollamaが利用できません。翻訳をスキップします。"
+            if not await self.app.ollama_available(ollama_client):
+                self.after(0, partial(
+                    self._current_message.configure,
+                    text="警告: Ollamaが利用できません。翻訳をスキップします。",
                 ))
                 translation = None
                 self._set_step_completed(ProcessingStep.TRANSLATE, "スキップ")
@@ -359,14 +406,12 @@ class ProcessingView(BaseView):
                 )
 
                 def translate_progress(progress: float, message: str):
-                    self.after(0, lambda: self._update_step_progress(
-                        ProcessingStep.TRANSLATE, progress, message
-                    ))
+                    self._post_step_progress(ProcessingStep.TRANSLATE, progress, message)
 
-                translation = await translator.translate_transcription(
+                translation = await self._await_cancellable(translator.translate_transcription(
                     transcription,
                     progress_callback=translate_progress,
-                )
+                ))
                 self._set_step_completed(ProcessingStep.TRANSLATE)
 
             if self._cancel_requested:
@@ -378,22 +423,16 @@ class ProcessingView(BaseView):
             if translation:
                 subtitle_generator = SubtitleGenerator()
 
-                # ASS形式
+                # ASS形式とSRT形式を同じ字幕データからまとめて生成
+                # （ファイル書き出しでイベントループを止めないようスレッドで実行）
                 ass_path = output_dir / f"{metadata.video_id}.ass"
-                subtitle_result = subtitle_generator.generate(
+                srt_path = output_dir / f"{metadata.video_id}.srt"
+                subtitle_result, _ = await asyncio.to_thread(
+                    subtitle_generator.generate_multi,
                     translation,
-                    ass_path,
-                    output_format=SubtitleFormat.ASS,
+                    [(ass_path, SubtitleFormat.ASS), (srt_path, SubtitleFormat.SRT)],
                 )
                 result["subtitle_path"] = subtitle_result.file_path
-
-                # SRT形式も生成
-                srt_path = output_dir / f"{metadata.video_id}.srt"
-                subtitle_generator.convert_format(
-                    ass_path,
-                    SubtitleFormat.SRT,
-                    srt_path,
-                )
                 result["srt_path"] = srt_path
 
             self._set_step_completed(ProcessingStep.GENERATE_SUBTITLE)
@@ -419,37 +458,93 @@ class ProcessingView(BaseView):
         except Exception as e:
             result["error"] = str(e)
             # 現在実行中のステップをエラーにする
-            for step in self._steps:
-                if step.status == "running":
-                    step.status = "error"
-                    step.message = "エラー"
-                    self.after(0, lambda s=step: self._update_step_ui(s))
+            step = self._running_step
+            if step is not None:
+                self._running_step = None
+                step.status = "error"
+                step.message = "エラー"
+                self.after(0, partial(self._update_step_ui, step))
+
+        finally:
+            if transcriber is not None:
+                self.app.release_transcriber_later()
 
         return result
 
+    async def _await_cancellable(self, awaitable):
+        """キャンセルボタンが押されるまで awaitable を待つ.
+
+        ステップの途中でもキャンセルされたら待機中のタスクを cancel して例外を送出する。
+        """
+        task = asyncio.ensure_future(awaitable)
+        cancel_wait = asyncio.ensure_future(self._cancel_event.wait())
+        try:
+            await asyncio.wait({task, cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            cancel_wait.cancel()
+
+        if not task.done():
+            task.cancel()
+            raise Exception("処理がキャンセルされました")
+        return task.result()
+
+    async def _set_cancel_event(self) -> None:
+        """イベントループ上でキャンセルイベントを set する."""
+        self._cancel_event.set()
+
     def _set_step_running(self, step_type: ProcessingStep) -> None:
         """ステップを実行中に設定."""
-        for step in self._steps:
-            if step.step == step_type:
-                step.status = "running"
-                step.progress = 0.0
-                step.message = "処理中..."
-                self.after(0, lambda s=step: self._update_step_ui(s))
-                self.after(0, lambda: self._current_message.configure(
-                    text=f"{step.label}を実行中..."
-                ))
-                break
+        step = self._steps_by_type[step_type]
+        step.status = "running"
+        self._running_step = step
+        step.progress = 0.0
+        step.message = "処理中..."
+        self.after(0, partial(self._update_step_ui, step))
+        self.after(0, partial(
+            self._current_message.configure,
+            text=f"{step.label}を実行中...",
+        ))
 
     def _set_step_completed(self, step_type: ProcessingStep, message: str = "完了") -> None:
         """ステップを完了に設定."""
-        for step in self._steps:
-            if step.step == step_type:
-                step.status = "completed"
-                step.progress = 100.0
-                step.message = message
-                self.after(0, lambda s=step: self._update_step_ui(s))
-                self.after(0, self._update_overall_progress)
-                break
+        step = self._steps_by_type[step_type]
+        if step is self._running_step:
+            self._running_step = None
+        if step.status != "completed":
+            self._completed_count += 1
+        step.status = "completed"
+        step.progress = 100.0
+        step.message = message
+        self.after(0, partial(self._update_step_ui, step))
+        self.after(0, self._update_overall_progress)
+
+    def _post_step_progress(
+        self,
+        step_type: ProcessingStep,
+        progress: float,
+        message: str,
+    ) -> None:
+        """処理スレッドから進捗を受け取り、UIへの反映を予約.
+
+        コールバックが頻繁に呼ばれても、ステップごとに最新の値だけを
+        PROGRESS_FLUSH_MS ごとに1回反映する。
+        """
+        self._pending_progress[step_type] = (progress, message)
+        if step_type not in self._flush_scheduled:
+            self._flush_scheduled.add(step_type)
+            self.after(self.PROGRESS_FLUSH_MS, partial(self._flush_step_progress, step_type))
+
+    def _flush_step_progress(self, step_type: ProcessingStep) -> None:
+        """予約された最新の進捗をUIに反映."""
+        self._flush_scheduled.discard(step_type)
+        pending = self._pending_progress.pop(step_type, None)
+        # 反映前にステップが完了・エラーになっていれば古い進捗は捨てる
+        if pending is None or self._steps_by_type[step_type].status != "running":
+            return
+        self._update_step_progress(step_type, *pending)
 
     def _update_step_progress(
         self,
@@ -458,13 +553,11 @@ class ProcessingView(BaseView):
         message: str,
     ) -> None:
         """ステップの進捗を更新."""
-        for step in self._steps:
-            if step.step == step_type:
-                step.progress = progress
-                step.message = message
-                self._update_step_ui(step)
-                self._update_overall_progress()
-                break
+        step = self._steps_by_type[step_type]
+        step.progress = progress
+        step.message = message
+        self._update_step_ui(step)
+        self._update_overall_progress()
 
     def _on_processing_complete(self, result: dict) -> None:
         """処理完了時."""
@@ -480,8 +573,10 @@ class ProcessingView(BaseView):
             )
         else:
             self._title_label.configure(text="処理エラー")
-            self._current_message.configure(text=f"エラー: {result['error']}")
-            self._current_message.configure(text_color=COLORS.DANGER)
+            self._current_message.configure(
+                text=f"エラー: {result['error']}",
+                text_color=COLORS.DANGER,
+            )
 
             # ボタンを切り替え
             self._cancel_button.pack_forget()
@@ -490,8 +585,10 @@ class ProcessingView(BaseView):
     def _on_processing_error(self, error: str) -> None:
         """処理エラー時."""
         self._title_label.configure(text="処理エラー")
-        self._current_message.configure(text=f"エラー: {error}")
-        self._current_message.configure(text_color=COLORS.DANGER)
+        self._current_message.configure(
+            text=f"エラー: {error}",
+            text_color=COLORS.DANGER,
+        )
 
         # ボタンを切り替え
         self._cancel_button.pack_forget()
@@ -501,6 +598,9 @@ class ProcessingView(BaseView):
         """キャンセルボタンクリック時."""
         self._cancel_requested = True
         self._current_message.configure(text="キャンセル中...")
+        # 待機中のステップをすぐに中断させる
+        if self._is_processing:
+            self.app.run_async(self._set_cancel_event())
 
     def _on_home_clicked(self) -> None:
         """ホームボタンクリック時."""
@@ -14,7 +14,7 @@ import customtkinter as ctk
 from ..theme import COLORS, SPACING
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineSegment:
     """タイムラインセグメント."""
     id: int
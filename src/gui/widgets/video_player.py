@@ -7,6 +7,8 @@ OpenCVベースの動画プレイヤー。字幕オーバーレイ機能付き
 
 import threading
 import time
+from bisect import bisect_right
+from itertools import accumulate
 from pathlib import Path
 from typing import Optional, Callable, List, Tuple
 from dataclasses import dataclass
@@ -17,7 +19,7 @@ from PIL import Image, ImageTk, ImageDraw, ImageFont
 import customtkinter as ctk
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleEntry:
     """字幕エントリ."""
     start_ms: int
@@ -52,6 +54,10 @@ class VideoPlayer(ctk.CTkFrame):
 
         # 字幕
         self._subtitles: List[SubtitleEntry] = []
+        # 開始時刻順のインデックス（_get_current_subtitle の二分探索用）
+        self._subtitle_order: List[int] = []
+        self._subtitle_starts: List[int] = []
+        self._subtitle_max_ends: List[int] = []
         self._current_subtitle: Optional[SubtitleEntry] = None
         self._forced_subtitle: Optional[SubtitleEntry] = None  # 強制表示用
         self._subtitle_font: Optional[ImageFont.FreeTypeFont] = None
@@ -144,6 +150,34 @@ class VideoPlayer(ctk.CTkFrame):
     def set_subtitles(self, subtitles: List[SubtitleEntry]) -> None:
         """字幕を設定."""
         self._subtitles = subtitles
+        self._index_subtitles()
+
+    def update_subtitle(self, index: int, start_ms: int, end_ms: int, text: str) -> None:
+        """指定インデックスの字幕だけをその場で書き換える."""
+        subtitle = self._subtitles[index]
+        reindex = subtitle.start_ms != start_ms
+        end_changed = subtitle.end_ms != end_ms
+        subtitle.start_ms = start_ms
+        subtitle.end_ms = end_ms
+        subtitle.text = text
+        if reindex:
+            self._index_subtitles()
+        elif end_changed:
+            self._index_subtitle_ends()
+
+    def _index_subtitles(self) -> None:
+        """字幕の開始時刻順インデックスを作り直す."""
+        subtitles = self._subtitles
+        self._subtitle_order = sorted(range(len(subtitles)), key=lambda i: subtitles[i].start_ms)
+        self._subtitle_starts = [subtitles[i].start_ms for i in self._subtitle_order]
+        self._index_subtitle_ends()
+
+    def _index_subtitle_ends(self) -> None:
+        """開始時刻順に見た終了時刻の累積最大を作り直す（重なった字幕の探索用）."""
+        subtitles = self._subtitles
+        self._subtitle_max_ends = list(
+            accumulate((subtitles[i].end_ms for i in self._subtitle_order), max)
+        )
 
     def set_subtitle_style(self, **style) -> None:
         """字幕スタイルを設定."""
@@ -160,11 +194,16 @@ class VideoPlayer(ctk.CTkFrame):
         self._forced_subtitle = None
 
     def _get_current_subtitle(self, position_ms: int) -> Optional[SubtitleEntry]:
-        """現在位置の字幕を取得."""
-        for sub in self._subtitles:
-            if sub.start_ms <= position_ms <= sub.end_ms:
-                return sub
-        return None
+        """現在位置の字幕を取得（重なっている場合は元の並びで先の字幕）."""
+        found = None
+        i = bisect_right(self._subtitle_starts, position_ms) - 1
+        # 終了時刻の累積最大が position_ms より前なら、それ以前に表示中の字幕はない
+        while i >= 0 and self._subtitle_max_ends[i] >= position_ms:
+            index = self._subtitle_order[i]
+            if position_ms <= self._subtitles[index].end_ms and (found is None or index < found):
+                found = index
+            i -= 1
+        return None if found is None else self._subtitles[found]
 
     def _draw_subtitle_on_frame(
         self,
@@ -47,12 +47,11 @@ async def process_video(
 
     # 1. 動画ダウンロード
     print("\n[1/5] 動画をダウンロード中...")
-    fetcher = VideoFetcher(download_dir=output_dir / "downloads")
-
-    download_result = await fetcher.download(
-        url,
-        progress_callback=print_progress,
-    )
+    async with VideoFetcher(download_dir=output_dir / "downloads") as fetcher:
+        download_result = await fetcher.download(
+            url,
+            progress_callback=print_progress,
+        )
 
     if not download_result.success:
         print(f"エラー: ダウンロード失敗 - {download_result.error}")
@@ -66,25 +65,37 @@ async def process_video(
     # 2. 音声抽出
     print("\n[2/5] 音声を抽出中...")
     audio_processor = AudioProcessor(temp_dir=output_dir / "temp")
-    audio_path = await audio_processor.extract_audio(
-        video_path,
-        progress_callback=print_progress,
-    )
-
-    # 3. 文字起こし
-    print("\n[3/5] 文字起こし中...")
     transcriber = Transcriber()
 
     try:
-        transcription = await transcriber.transcribe(
-            audio_path,
-            progress_callback=print_progress,
+        # 文字起こしモデルの読み込みを音声抽出と並行して行う
+        # （片方が失敗しても、もう片方の完了を待ってから後片付けする）
+        audio_path, preload_error = await asyncio.gather(
+            audio_processor.extract_audio(
+                video_path,
+                progress_callback=print_progress,
+            ),
+            transcriber.preload(),
+            return_exceptions=True,
         )
-        print(f"検出言語: {transcription.language}")
-        print(f"セグメント数: {len(transcription.segments)}")
-    except Exception as e:
-        print(f"エラー: 文字起こし失敗 - {e}")
-        return
+        if isinstance(audio_path, BaseException):
+            raise audio_path
+
+        # 3. 文字起こし
+        print("\n[3/5] 文字起こし中...")
+
+        try:
+            if isinstance(preload_error, BaseException):
+                raise preload_error
+            transcription = await transcriber.transcribe(
+                audio_path,
+                progress_callback=print_progress,
+            )
+            print(f"検出言語: {transcription.language}")
+            print(f"セグメント数: {len(transcription.segments)}")
+        except Exception as e:
+            print(f"エラー: 文字起こし失敗 - {e}")
+            return
     finally:
         transcriber.unload_model()
 
@@ -120,23 +131,15 @@ async def process_video(
     if translation:
         subtitle_generator = SubtitleGenerator()
 
-        # ASS形式
+        # ASS形式とSRT形式を同じ字幕データからまとめて生成
         ass_path = output_dir / f"{metadata.video_id}.ass"
-        result = subtitle_generator.generate(
+        srt_path = output_dir / f"{metadata.video_id}.srt"
+        result, _ = subtitle_generator.generate_multi(
             translation,
-            ass_path,
-            output_format=SubtitleFormat.ASS,
+            [(ass_path, SubtitleFormat.ASS), (srt_path, SubtitleFormat.SRT)],
         )
         print(f"字幕生成完了: {result.file_path}")
-
-        # SRT形式も生成
-        srt_path = output_dir / f"{metadata.video_id}.srt"
-        subtitle_generator.convert_format(
-            ass_path,
-            SubtitleFormat.SRT,
-            srt_path,
-        )
-        print(f"SRT変換完了: {srt_path}")
+        print(f"SRT生成完了: {srt_path}")
 
     # 完了
     print("\n" + "=" * 50)
@@ -169,17 +172,17 @@ async def analyze_video(url: str, output_dir: Path = Path("./output")) -> None:
 
     # 1. 動画情報取得
     print("\n[1/4] 動画情報を取得中...")
-    fetcher = VideoFetcher(download_dir=output_dir / "downloads")
-    info = await fetcher.get_video_info(url)
-    print(f"タイトル: {info.title}")
-    print(f"長さ: {info.duration:.0f}秒")
-
-    # 2. 動画ダウンロード
-    print("\n[2/4] 動画をダウンロード中...")
-    download_result = await fetcher.download(
-        url,
-        progress_callback=print_progress,
-    )
+    async with VideoFetcher(download_dir=output_dir / "downloads") as fetcher:
+        info = await fetcher.get_video_info(url)
+        print(f"タイトル: {info.title}")
+        print(f"長さ: {info.duration:.0f}秒")
+
+        # 2. 動画ダウンロード
+        print("\n[2/4] 動画をダウンロード中...")
+        download_result = await fetcher.download(
+            url,
+            progress_callback=print_progress,
+        )
 
     if not download_result.success:
         print(f"エラー: ダウンロード失敗 - {download_result.error}")
@@ -190,18 +193,29 @@ async def analyze_video(url: str, output_dir: Path = Path("./output")) -> None:
     # 3. 音声抽出 & 文字起こし
     print("\n[3/4] 文字起こし中...")
     audio_processor = AudioProcessor(temp_dir=output_dir / "temp")
-    audio_path = await audio_processor.extract_audio(video_path)
-
     transcriber = Transcriber()
 
     try:
-        transcription = await transcriber.transcribe(
-            audio_path,
-            progress_callback=print_progress,
+        # 文字起こしモデルの読み込みを音声抽出と並行して行う
+        # （片方が失敗しても、もう片方の完了を待ってから後片付けする）
+        audio_path, preload_error = await asyncio.gather(
+            audio_processor.extract_audio(video_path),
+            transcriber.preload(),
+            return_exceptions=True,
         )
-    except Exception as e:
-        print(f"エラー: 文字起こし失敗 - {e}")
-        return
+        if isinstance(audio_path, BaseException):
+            raise audio_path
+
+        try:
+            if isinstance(preload_error, BaseException):
+                raise preload_error
+            transcription = await transcriber.transcribe(
+                audio_path,
+                progress_callback=print_progress,
+            )
+        except Exception as e:
+            print(f"エラー: 文字起こし失敗 - {e}")
+            return
     finally:
         transcriber.unload_model()
 
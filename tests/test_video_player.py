@@ -0,0 +1,49 @@
+"""動画プレイヤーの字幕検索のテスト."""
+
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("customtkinter")
+
+from src.gui.widgets.video_player import SubtitleEntry, VideoPlayer  # noqa: E402
+
+
+def _make_player(subtitles: list[SubtitleEntry]) -> VideoPlayer:
+    """ウィンドウを作らずに字幕検索だけを使うプレイヤーを作成."""
+    player = VideoPlayer.__new__(VideoPlayer)
+    player._subtitles = subtitles
+    player._index_subtitles()
+    return player
+
+
+def test_get_current_subtitle_returns_active_entry():
+    first = SubtitleEntry(start_ms=0, end_ms=1000, text="first")
+    second = SubtitleEntry(start_ms=2000, end_ms=3000, text="second")
+    player = _make_player([first, second])
+
+    assert player._get_current_subtitle(500) is first
+    assert player._get_current_subtitle(2500) is second
+    assert player._get_current_subtitle(1500) is None
+    assert player._get_current_subtitle(3500) is None
+
+
+def test_get_current_subtitle_with_overlapping_entries():
+    long_entry = SubtitleEntry(start_ms=0, end_ms=10000, text="long")
+    short_entry = SubtitleEntry(start_ms=2000, end_ms=3000, text="short")
+    player = _make_player([long_entry, short_entry])
+
+    # 短い字幕が終わった後も、長い字幕は表示されたまま
+    assert player._get_current_subtitle(5000) is long_entry
+    # 両方表示中なら元の並びで先の字幕
+    assert player._get_current_subtitle(2500) is long_entry
+    assert player._get_current_subtitle(10001) is None
+
+
+def test_update_subtitle_end_extends_overlap():
+    first = SubtitleEntry(start_ms=0, end_ms=1000, text="first")
+    second = SubtitleEntry(start_ms=2000, end_ms=3000, text="second")
+    player = _make_player([first, second])
+
+    # 終了時刻だけを延ばしても、後ろの字幕の範囲で見つかる
+    player.update_subtitle(0, 0, 5000, "first")
+    assert player._get_current_subtitle(4000) is first